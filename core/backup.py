@@ -1,17 +1,103 @@
 """
 Módulo de backup do sistema ReplicOOP
 """
+import atexit
+import io
 import os
 import subprocess
+import sys
 import gzip
 import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, List, Dict
-import json
+from typing import Optional, List, Dict, Tuple
 
 from .config import DatabaseConfig
 from .logger import LoggerManager
 from .database import DatabaseManager
+from .utils import JsonUtils
+
+
+# Tamanho do bloco usado para transferir dados entre processos e arquivos
+STREAM_CHUNK_SIZE = 1 << 20
+
+# Argumentos de Popen para pipes grandes (pipesize só existe a partir do Python 3.10)
+PIPE_KWARGS = {'bufsize': STREAM_CHUNK_SIZE}
+if sys.version_info >= (3, 10):
+    PIPE_KWARGS['pipesize'] = STREAM_CHUNK_SIZE
+
+# Nível de compressão do gzip do Python (1 é bem mais rápido que 9 com tamanho similar em SQL)
+GZIP_COMPRESS_LEVEL = 1
+
+# Máximo de consultas SHOW CREATE TABLE simultâneas no backup de estrutura
+STRUCTURE_DUMP_WORKERS = 16
+
+# Máximo de arquivos .meta lidos simultaneamente ao reconstruir o índice
+METADATA_READ_WORKERS = 8
+
+# Tamanho padrão do buffer de escrita dos arquivos de backup
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Bloco escrito para cada tabela no backup de estrutura
+STRUCTURE_TABLE_TEMPLATE = (
+    "-- Estrutura da tabela {table}\n"
+    "DROP TABLE IF EXISTS `{table}`;\n"
+    "{create_statement};\n\n"
+)
+
+# Prefixo da linha de metadados embutida no início dos backups completos (.gz)
+EMBEDDED_META_PREFIX = "-- REPLICOOP_META: "
+
+# Quantidade de bytes lida do início do backup para localizar os metadados embutidos
+EMBEDDED_META_READ_SIZE = 4096
+
+# Arquivo com o índice consolidado dos metadados de todos os backups
+BACKUP_INDEX_FILENAME = "_backups_index.json"
+
+
+def stream_to_process(source, process: subprocess.Popen) -> Tuple[bytes, bytes]:
+    """
+    Envia o conteúdo de um arquivo para o stdin de um processo em blocos,
+    mantendo o uso de memória limitado ao tamanho do bloco
+    
+    Args:
+        source: Arquivo binário de origem
+        process (subprocess.Popen): Processo com stdin, stdout e stderr em PIPE
+        
+    Returns:
+        Tuple[bytes, bytes]: Saídas stdout e stderr do processo
+    """
+    outputs = {}
+    
+    def drain(name, stream):
+        outputs[name] = stream.read()
+    
+    # Drena stdout/stderr em paralelo para evitar deadlock com o pipe cheio
+    readers = [
+        threading.Thread(target=drain, args=('stdout', process.stdout), daemon=True),
+        threading.Thread(target=drain, args=('stderr', process.stderr), daemon=True)
+    ]
+    for reader in readers:
+        reader.start()
+    
+    try:
+        shutil.copyfileobj(source, process.stdin, STREAM_CHUNK_SIZE)
+    except BrokenPipeError:
+        # Processo encerrou antes de consumir toda a entrada; o erro vem no stderr
+        pass
+    finally:
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+    
+    process.wait()
+    for reader in readers:
+        reader.join()
+    
+    return outputs.get('stdout', b''), outputs.get('stderr', b'')
 
 
 class BackupError(Exception):
@@ -22,8 +108,16 @@ class BackupError(Exception):
 class BackupManager:
     """Gerenciador de backups do sistema"""
     
+    # Serializa atualizações do índice entre instâncias (backups paralelos no mesmo diretório)
+    _index_lock = threading.Lock()
+    
     def __init__(self, db_manager: DatabaseManager, logger: LoggerManager, 
-                 backup_path: str):
+                 backup_path: str, compressor: Optional[List[str]] = None,
+                 compress_extension: str = ".gz",
+                 write_buffer_size: int = WRITE_BUFFER_SIZE,
+                 extended_insert: bool = True,
+                 net_buffer_length: int = 16 << 20,
+                 max_allowed_packet: int = 64 << 20):
         """
         Inicializa o gerenciador de backup
         
@@ -31,11 +125,36 @@ class BackupManager:
             db_manager (DatabaseManager): Gerenciador de banco de dados
             logger (LoggerManager): Gerenciador de logs
             backup_path (str): Caminho para armazenar backups
+            compressor (List[str], optional): Comando do compressor externo
+                (padrão: pigz paralelo com todos os núcleos)
+            compress_extension (str): Extensão gerada pelo compressor externo
+            write_buffer_size (int): Tamanho do buffer de escrita dos arquivos de backup
+            extended_insert (bool): INSERTs com múltiplas linhas no mysqldump (restauração
+                mais rápida); False gera uma linha por INSERT, com escritas menores que
+                fluem melhor para compressores lentos em tabelas muito grandes
+            net_buffer_length (int): Tamanho máximo de cada INSERT estendido do mysqldump
+            max_allowed_packet (int): Tamanho máximo de pacote usado pelo mysqldump
         """
         self.db_manager = db_manager
         self.logger = logger
         self.backup_path = backup_path
+        self.compressor = compressor or ["pigz", "-p", str(os.cpu_count() or 1)]
+        self.compress_extension = compress_extension
+        self.write_buffer_size = write_buffer_size
+        self.extended_insert = extended_insert
+        self.net_buffer_length = net_buffer_length
+        self.max_allowed_packet = max_allowed_packet
+        self._index_path = os.path.join(backup_path, BACKUP_INDEX_FILENAME)
+        self._index_cache = None
+        self._wire_compression_args = {}
+        self._defaults_file = None
+        self._mysqldump_cmd = None
+        self._mysql_cmd = None
+        self._compressor_available = shutil.which(self.compressor[0]) is not None
         os.makedirs(backup_path, exist_ok=True)
+        
+        if not self._compressor_available:
+            self.logger.debug(f"Compressor {self.compressor[0]} não encontrado, usando gzip do Python")
     
     def _is_mysqldump_available(self) -> bool:
         """Verifica se o mysqldump está disponível no sistema"""
@@ -46,18 +165,125 @@ class BackupManager:
         except (subprocess.SubprocessError, FileNotFoundError, subprocess.TimeoutExpired):
             return False
     
-    def _create_python_backup(self, environment: str, backup_filepath: str) -> None:
+    def _get_wire_compression_args(self, program: str) -> List[str]:
+        """
+        Detecta (uma única vez por programa) as opções de compressão do protocolo
+        suportadas pelo cliente MySQL
+        
+        Args:
+            program (str): Programa cliente (mysqldump, mysql)
+            
+        Returns:
+            List[str]: Argumentos de compressão a adicionar ao comando
+        """
+        if program in self._wire_compression_args:
+            return self._wire_compression_args[program]
+        
+        args = []
+        try:
+            result = subprocess.run([program, '--help'], 
+                                  capture_output=True, text=True, timeout=10)
+            if '--compression-algorithms' in result.stdout:
+                # MySQL 8.0.18+: zstd com fallback para zlib ou sem compressão
+                args = ["--compression-algorithms=zstd,zlib,uncompressed", "--zstd-compression-level=3"]
+            elif '--compress' in result.stdout:
+                args = ["--compress"]
+        except (subprocess.SubprocessError, FileNotFoundError, subprocess.TimeoutExpired):
+            pass
+        
+        self.logger.debug(f"Compressão de protocolo para {program}: {' '.join(args) or 'indisponível'}")
+        self._wire_compression_args[program] = args
+        return args
+    
+    def _get_defaults_file(self) -> str:
+        """
+        Cria (uma única vez) o arquivo de opções com as credenciais do cliente MySQL,
+        evitando expor a senha na linha de comando
+        
+        Returns:
+            str: Caminho do arquivo de opções
+        """
+        if self._defaults_file is None:
+            config = self.db_manager.config
+            password = str(config.password).replace('\\', '\\\\').replace('"', '\\"')
+            
+            # mkstemp cria o arquivo com permissão 0600
+            fd, path = tempfile.mkstemp(prefix="replicoop_", suffix=".cnf")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write("[client]\n")
+                f.write(f"host={config.host}\n")
+                f.write(f"port={config.port}\n")
+                f.write(f"user={config.username}\n")
+                f.write(f'password="{password}"\n')
+            
+            atexit.register(self._remove_file, path)
+            self._defaults_file = path
+        
+        return self._defaults_file
+    
+    def _get_mysqldump_command(self) -> Tuple[str, ...]:
+        """
+        Monta (uma única vez) o comando mysqldump do backup completo
+        
+        Returns:
+            Tuple[str, ...]: Argumentos do comando
+        """
+        if self._mysqldump_cmd is None:
+            self._mysqldump_cmd = (
+                "mysqldump",
+                f"--defaults-extra-file={self._get_defaults_file()}",
+                "--single-transaction",
+                "--routines",
+                "--triggers",
+                "--events",
+                "--add-drop-table",
+                "--create-options",
+                "--disable-keys",
+                "--extended-insert" if self.extended_insert else "--skip-extended-insert",
+                "--quick",
+                "--lock-tables=false",
+                f"--net-buffer-length={self.net_buffer_length}",
+                f"--max-allowed-packet={self.max_allowed_packet}",
+                *self._get_wire_compression_args("mysqldump"),
+                self.db_manager.config.dbname
+            )
+        return self._mysqldump_cmd
+    
+    def _get_mysql_command(self) -> Tuple[str, ...]:
+        """
+        Monta (uma única vez) o comando mysql usado na restauração
+        
+        Returns:
+            Tuple[str, ...]: Argumentos do comando
+        """
+        if self._mysql_cmd is None:
+            self._mysql_cmd = (
+                "mysql",
+                f"--defaults-extra-file={self._get_defaults_file()}",
+                *self._get_wire_compression_args("mysql"),
+                self.db_manager.config.dbname
+            )
+        return self._mysql_cmd
+    
+    def _create_python_backup(self, environment: str, backup_filepath: str,
+                              metadata: Optional[Dict] = None,
+                              timestamp: Optional[str] = None) -> None:
         """
         Cria backup usando apenas Python (sem mysqldump)
         
         Args:
             environment (str): Ambiente do banco
             backup_filepath (str): Caminho do arquivo de backup
+            metadata (Dict, optional): Metadados a embutir no início do arquivo
+            timestamp (str, optional): Data/hora ISO do backup (padrão: agora)
         """
         try:
             with gzip.open(backup_filepath, 'wt', encoding='utf-8') as f:
+                if metadata is not None:
+                    f.write(self._format_embedded_metadata(metadata).decode('utf-8'))
+                
                 # Cabeçalho do backup
-                f.write(f"-- Backup Python - {datetime.now().isoformat()}\n")
+                f.write(f"-- Backup Python - {timestamp or datetime.now().isoformat()}\n")
                 f.write(f"-- Banco: {self.db_manager.config.dbname}\n")
                 f.write(f"-- Ambiente: {environment}\n\n")
                 
@@ -140,25 +366,37 @@ class BackupManager:
         Returns:
             str: Caminho do arquivo de backup criado
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_filename = f"{self.db_manager.config.dbname}_{environment}_{timestamp}.sql.gz"
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        use_mysqldump = self._is_mysqldump_available()
+        
+        # Compressor externo só é usado no pipeline do mysqldump
+        extension = self.compress_extension if use_mysqldump and self._compressor_available else ".gz"
+        backup_filename = f"{self.db_manager.config.dbname}_{environment}_{timestamp}.sql{extension}"
         backup_filepath = os.path.join(self.backup_path, backup_filename)
         
+        # Backups gzip levam os metadados embutidos no próprio arquivo (sem .meta)
+        metadata = self._build_backup_metadata(backup_filepath, environment, timestamp=now.isoformat())
+        embedded_metadata = metadata if extension == ".gz" else None
+        
         try:
             self.logger.info(f"Iniciando backup completo do banco {self.db_manager.config.dbname}")
             
             # Verifica se mysqldump está disponível
-            if self._is_mysqldump_available():
+            if use_mysqldump:
                 self.logger.info("Usando mysqldump para backup")
-                self._create_mysqldump_backup(backup_filepath)
+                self._create_mysqldump_backup(backup_filepath, embedded_metadata)
             else:
                 self.logger.info("mysqldump não encontrado, usando backup Python")
-                self._create_python_backup(environment, backup_filepath)
+                self._create_python_backup(environment, backup_filepath, embedded_metadata,
+                                           timestamp=metadata['timestamp'])
             
-            # Cria arquivo de metadados do backup
-            self._create_backup_metadata(backup_filepath, environment)
+            # Registra os metadados do backup
+            backup_size = os.stat(backup_filepath).st_size
+            self._create_backup_metadata(backup_filepath, environment, size_bytes=backup_size,
+                                         metadata=metadata,
+                                         write_sidecar=embedded_metadata is None)
             
-            backup_size = os.path.getsize(backup_filepath)
             self.logger.info(f"Backup criado com sucesso: {backup_filename} ({backup_size} bytes)")
             
             return backup_filepath
@@ -167,51 +405,166 @@ class BackupManager:
             self.logger.error(f"Erro durante backup: {e}")
             raise BackupError(f"Falha no backup: {e}")
     
-    def _create_mysqldump_backup(self, backup_filepath: str) -> None:
+    def create_full_backups(self, configs: List[Tuple[DatabaseConfig, str]],
+                            max_parallel: int = 4) -> List[Optional[str]]:
+        """
+        Cria backups completos de vários bancos/ambientes em paralelo
+        
+        Cada backup roda seu próprio pipeline mysqldump/compressor (processos separados);
+        o paralelismo é limitado para não sobrecarregar os servidores de origem.
+        
+        Args:
+            configs (List[Tuple[DatabaseConfig, str]]): Pares (configuração, ambiente)
+            max_parallel (int): Máximo de backups simultâneos
+            
+        Returns:
+            List[Optional[str]]: Caminho de cada backup, na ordem de configs (None se falhou)
+        """
+        if not configs:
+            return []
+        
+        workers = max(1, min(max_parallel, os.cpu_count() or 1, len(configs)))
+        self.logger.info(f"Criando {len(configs)} backups completos ({workers} em paralelo)")
+        
+        results = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._create_backup_for_config, config, environment)
+                       for config, environment in configs]
+            
+            for (config, environment), future in zip(configs, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    self.logger.error(f"Backup de {config.dbname} ({environment}) falhou: {e}")
+                    results.append(None)
+        
+        return results
+    
+    def _create_backup_for_config(self, config: DatabaseConfig, environment: str) -> str:
+        """
+        Cria backup completo de um banco usando as mesmas opções deste gerenciador
+        
+        Args:
+            config (DatabaseConfig): Configuração do banco
+            environment (str): Ambiente do banco
+            
+        Returns:
+            str: Caminho do arquivo de backup criado
+        """
+        manager = BackupManager(
+            DatabaseManager(config, self.logger), self.logger, self.backup_path,
+            compressor=self.compressor,
+            compress_extension=self.compress_extension,
+            write_buffer_size=self.write_buffer_size,
+            extended_insert=self.extended_insert,
+            net_buffer_length=self.net_buffer_length,
+            max_allowed_packet=self.max_allowed_packet
+        )
+        return manager.create_full_backup(environment)
+    
+    def _create_mysqldump_backup(self, backup_filepath: str,
+                                 metadata: Optional[Dict] = None) -> None:
         """
         Cria backup usando mysqldump
         
         Args:
             backup_filepath (str): Caminho do arquivo de backup
+            metadata (Dict, optional): Metadados a embutir no início do arquivo
         """
         # Comando mysqldump
-        mysqldump_cmd = [
-            "mysqldump",
-            f"--host={self.db_manager.config.host}",
-            f"--port={self.db_manager.config.port}",
-            f"--user={self.db_manager.config.username}",
-            f"--password={self.db_manager.config.password}",
-            "--single-transaction",
-            "--routines",
-            "--triggers",
-            "--events",
-            "--add-drop-table",
-            "--create-options",
-            "--disable-keys",
-            "--extended-insert",
-            "--quick",
-            "--lock-tables=false",
-            self.db_manager.config.dbname
-        ]
+        mysqldump_cmd = list(self._get_mysqldump_command())
         
         # Executa mysqldump e comprime o resultado
         self.logger.debug(f"Executando comando mysqldump")
         
+        if self._compressor_available:
+            self._run_compressed_dump(mysqldump_cmd, backup_filepath, metadata)
+            return
+        
         process = subprocess.Popen(
             mysqldump_cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            universal_newlines=True
+            **PIPE_KWARGS
         )
         
-        # Comprime e salva o backup
-        with gzip.open(backup_filepath, 'wt', encoding='utf-8') as f:
-            stdout, stderr = process.communicate()
+        # Drena stderr em paralelo para evitar deadlock com o pipe cheio
+        stderr_chunks = []
+        stderr_thread = threading.Thread(
+            target=lambda: stderr_chunks.append(process.stderr.read()),
+            daemon=True
+        )
+        stderr_thread.start()
+        
+        # Comprime e salva o backup em blocos, sem carregar o dump inteiro na memória
+        try:
+            with open(backup_filepath, 'wb', buffering=STREAM_CHUNK_SIZE) as output, \
+                    gzip.GzipFile(fileobj=output, mode='wb', compresslevel=GZIP_COMPRESS_LEVEL) as f:
+                if metadata is not None:
+                    f.write(self._format_embedded_metadata(metadata))
+                shutil.copyfileobj(process.stdout, f, STREAM_CHUNK_SIZE)
+        finally:
+            process.stdout.close()
+            process.wait()
+            stderr_thread.join()
+        
+        if process.returncode != 0:
+            stderr = b''.join(stderr_chunks).decode('utf-8', errors='replace')
+            raise BackupError(f"Erro no mysqldump: {stderr}")
+    
+    def _run_compressed_dump(self, mysqldump_cmd: List[str], backup_filepath: str,
+                             metadata: Optional[Dict] = None) -> None:
+        """
+        Executa mysqldump encadeado ao compressor externo (pigz/zstd)
+        
+        Args:
+            mysqldump_cmd (List[str]): Comando mysqldump
+            backup_filepath (str): Caminho do arquivo de backup
+            metadata (Dict, optional): Metadados a embutir no início do arquivo (apenas gzip)
+        """
+        self.logger.debug(f"Comprimindo com {' '.join(self.compressor)}")
+        
+        with open(backup_filepath, 'wb') as output:
+            if metadata is not None:
+                # Membro gzip próprio com os metadados; a saída do pigz é concatenada em seguida
+                output.write(gzip.compress(self._format_embedded_metadata(metadata),
+                                           compresslevel=GZIP_COMPRESS_LEVEL))
+                output.flush()
             
-            if process.returncode != 0:
-                raise BackupError(f"Erro no mysqldump: {stderr}")
+            dump = subprocess.Popen(
+                mysqldump_cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                **PIPE_KWARGS
+            )
+            compress = subprocess.Popen(
+                self.compressor + ["-c"],
+                stdin=dump.stdout,
+                stdout=output,
+                stderr=subprocess.PIPE,
+                **PIPE_KWARGS
+            )
+            # Fecha a cópia local do pipe para o mysqldump receber SIGPIPE se o compressor falhar
+            dump.stdout.close()
             
-            f.write(stdout)
+            # Drena o stderr do mysqldump em paralelo enquanto o compressor é aguardado
+            dump_stderr_chunks = []
+            dump_stderr_thread = threading.Thread(
+                target=lambda: dump_stderr_chunks.append(dump.stderr.read()),
+                daemon=True
+            )
+            dump_stderr_thread.start()
+            
+            _, compress_stderr = compress.communicate()
+            dump.wait()
+            dump_stderr_thread.join()
+        
+        if dump.returncode != 0:
+            dump_stderr = b''.join(dump_stderr_chunks).decode('utf-8', errors='replace')
+            raise BackupError(f"Erro no mysqldump: {dump_stderr}")
+        
+        if compress.returncode != 0:
+            raise BackupError(f"Erro no compressor: {compress_stderr.decode('utf-8', errors='replace')}")
     
     def create_structure_backup(self, tables: Optional[List[str]] = None, 
                               environment: str = "production") -> str:
@@ -225,42 +578,56 @@ class BackupManager:
         Returns:
             str: Caminho do arquivo de backup criado
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        iso_timestamp = now.isoformat()
         backup_filename = f"{self.db_manager.config.dbname}_structure_{environment}_{timestamp}.sql"
         backup_filepath = os.path.join(self.backup_path, backup_filename)
         
         try:
             self.logger.info(f"Criando backup de estrutura para {len(tables) if tables else 'todas as'} tabelas")
             
-            with open(backup_filepath, 'w', encoding='utf-8') as f:
+            with open(backup_filepath, 'w', encoding='utf-8', buffering=self.write_buffer_size) as f:
+                # Acumula o conteúdo em memória e grava em blocos de write_buffer_size
+                buffer = io.StringIO()
+                
                 # Cabeçalho do backup
-                f.write(f"-- Backup de Estrutura - {datetime.now().isoformat()}\n")
-                f.write(f"-- Banco: {self.db_manager.config.dbname}\n")
-                f.write(f"-- Ambiente: {environment}\n\n")
+                buffer.write(f"-- Backup de Estrutura - {iso_timestamp}\n")
+                buffer.write(f"-- Banco: {self.db_manager.config.dbname}\n")
+                buffer.write(f"-- Ambiente: {environment}\n\n")
                 
-                f.write("SET FOREIGN_KEY_CHECKS = 0;\n\n")
+                buffer.write("SET FOREIGN_KEY_CHECKS = 0;\n\n")
                 
                 # Se tabelas não foram especificadas, obtém todas
                 if not tables:
                     tables = self.db_manager.get_tables()
                 
-                for table in tables:
-                    try:
-                        # Obtém statement CREATE TABLE
-                        create_statement = self.db_manager.get_create_table_statement(table)
-                        
-                        f.write(f"-- Estrutura da tabela {table}\n")
-                        f.write(f"DROP TABLE IF EXISTS `{table}`;\n")
-                        f.write(f"{create_statement};\n\n")
-                        
-                    except Exception as e:
-                        self.logger.warning(f"Erro ao obter estrutura da tabela {table}: {e}")
+                # Obtém os statements CREATE TABLE em paralelo (cada chamada usa sua própria conexão)
+                # e escreve na ordem original das tabelas
+                with ThreadPoolExecutor(max_workers=max(1, min(STRUCTURE_DUMP_WORKERS, len(tables)))) as executor:
+                    results = list(executor.map(self._fetch_create_statement, tables))
+                
+                for table, create_statement, error in results:
+                    if error is not None:
+                        self.logger.warning(f"Erro ao obter estrutura da tabela {table}: {error}")
                         continue
+                    
+                    buffer.write(STRUCTURE_TABLE_TEMPLATE.format_map(
+                        {'table': table, 'create_statement': create_statement}
+                    ))
+                    
+                    if buffer.tell() >= self.write_buffer_size:
+                        f.write(buffer.getvalue())
+                        buffer.seek(0)
+                        buffer.truncate()
                 
-                f.write("SET FOREIGN_KEY_CHECKS = 1;\n")
+                buffer.write("SET FOREIGN_KEY_CHECKS = 1;\n")
+                f.write(buffer.getvalue())
             
             # Cria arquivo de metadados
-            self._create_backup_metadata(backup_filepath, environment, backup_type="structure")
+            self._create_backup_metadata(backup_filepath, environment, backup_type="structure",
+                                         size_bytes=os.stat(backup_filepath).st_size,
+                                         timestamp=iso_timestamp)
             
             self.logger.info(f"Backup de estrutura criado: {backup_filename}")
             return backup_filepath
@@ -269,31 +636,215 @@ class BackupManager:
             self.logger.error(f"Erro ao criar backup de estrutura: {e}")
             raise BackupError(f"Falha no backup de estrutura: {e}")
     
-    def _create_backup_metadata(self, backup_filepath: str, environment: str, 
-                              backup_type: str = "full") -> None:
+    def _fetch_create_statement(self, table: str) -> Tuple[str, Optional[str], Optional[Exception]]:
         """
-        Cria arquivo de metadados para o backup
+        Obtém o statement CREATE TABLE de uma tabela sem propagar erros
+        
+        Args:
+            table (str): Nome da tabela
+            
+        Returns:
+            Tuple[str, Optional[str], Optional[Exception]]: Tabela, statement e erro (se houver)
+        """
+        try:
+            return table, self.db_manager.get_create_table_statement(table), None
+        except Exception as e:
+            return table, None, e
+    
+    def _build_backup_metadata(self, backup_filepath: str, environment: str,
+                               backup_type: str = "full",
+                               timestamp: Optional[str] = None) -> Dict:
+        """
+        Monta o dicionário de metadados de um backup (sem o tamanho do arquivo)
         
         Args:
             backup_filepath (str): Caminho do arquivo de backup
             environment (str): Ambiente do backup
             backup_type (str): Tipo do backup (full, structure, etc.)
+            timestamp (str, optional): Data/hora ISO do backup (padrão: agora)
+            
+        Returns:
+            Dict: Metadados do backup
         """
-        metadata = {
+        return {
             "backup_file": os.path.basename(backup_filepath),
             "backup_path": backup_filepath,
             "database": self.db_manager.config.dbname,
             "environment": environment,
             "backup_type": backup_type,
-            "timestamp": datetime.now().isoformat(),
-            "size_bytes": os.path.getsize(backup_filepath) if os.path.exists(backup_filepath) else 0,
+            "timestamp": timestamp or datetime.now().isoformat(),
+            "size_bytes": 0,
             "host": self.db_manager.config.host,
             "port": self.db_manager.config.port
         }
+    
+    @staticmethod
+    def _format_embedded_metadata(metadata: Dict) -> bytes:
+        """
+        Formata os metadados como linha de comentário SQL para o início do backup
         
-        metadata_filepath = backup_filepath + ".meta"
-        with open(metadata_filepath, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        Args:
+            metadata (Dict): Metadados do backup
+            
+        Returns:
+            bytes: Linha de comentário terminada em quebra de linha
+        """
+        return f"{EMBEDDED_META_PREFIX}{JsonUtils.dumps(metadata)}\n".encode('utf-8')
+    
+    def _read_embedded_metadata(self, entry: os.DirEntry) -> Optional[Dict]:
+        """
+        Lê os metadados embutidos no início de um backup .gz
+        
+        Args:
+            entry (os.DirEntry): Entrada do arquivo de backup
+            
+        Returns:
+            Optional[Dict]: Metadados ou None se o arquivo não os tiver
+        """
+        try:
+            with gzip.open(entry.path, 'rb') as f:
+                head = f.read(EMBEDDED_META_READ_SIZE)
+        except (OSError, EOFError) as e:
+            self.logger.warning(f"Erro ao ler cabeçalho de {entry.name}: {e}")
+            return None
+        
+        first_line = head.split(b'\n', 1)[0].decode('utf-8', errors='replace')
+        if not first_line.startswith(EMBEDDED_META_PREFIX):
+            return None
+        
+        try:
+            metadata = JsonUtils.loads(first_line[len(EMBEDDED_META_PREFIX):])
+        except ValueError as e:
+            self.logger.warning(f"Metadados embutidos inválidos em {entry.name}: {e}")
+            return None
+        
+        metadata['size_bytes'] = entry.stat().st_size
+        return metadata
+    
+    def _create_backup_metadata(self, backup_filepath: str, environment: str, 
+                              backup_type: str = "full",
+                              size_bytes: Optional[int] = None,
+                              metadata: Optional[Dict] = None,
+                              write_sidecar: bool = True,
+                              timestamp: Optional[str] = None) -> None:
+        """
+        Registra os metadados do backup no índice e, opcionalmente, no arquivo .meta
+        
+        Args:
+            backup_filepath (str): Caminho do arquivo de backup
+            environment (str): Ambiente do backup
+            backup_type (str): Tipo do backup (full, structure, etc.)
+            size_bytes (int, optional): Tamanho já conhecido do arquivo (evita novo stat)
+            metadata (Dict, optional): Metadados já montados (ex.: os embutidos no backup)
+            write_sidecar (bool): Se deve gravar o arquivo .meta ao lado do backup
+            timestamp (str, optional): Data/hora ISO do backup (padrão: agora)
+        """
+        if size_bytes is None:
+            try:
+                size_bytes = os.stat(backup_filepath).st_size
+            except FileNotFoundError:
+                size_bytes = 0
+        
+        if metadata is None:
+            metadata = self._build_backup_metadata(backup_filepath, environment, backup_type, timestamp)
+        metadata = dict(metadata, size_bytes=size_bytes)
+        
+        if write_sidecar:
+            metadata_filepath = backup_filepath + ".meta"
+            JsonUtils.dump(metadata, metadata_filepath)
+        
+        # Atualiza o índice consolidado de backups
+        try:
+            with self._index_lock:
+                entries = [entry for entry in self._load_index()
+                           if entry.get('backup_file') != metadata['backup_file']]
+                entries.append(metadata)
+                self._write_index(entries)
+        except Exception as e:
+            self.logger.warning(f"Erro ao atualizar índice de backups: {e}")
+    
+    def _scan_metadata_files(self) -> List[Dict]:
+        """
+        Lê todos os arquivos .meta do diretório de backups
+        
+        Returns:
+            List[Dict]: Metadados encontrados
+        """
+        with os.scandir(self.backup_path) as entries:
+            entries = list(entries)
+        
+        names = {entry.name for entry in entries}
+        metadata_paths = [entry.path for entry in entries if entry.name.endswith('.meta')]
+        # Backups .gz sem .meta carregam os metadados na primeira linha do dump
+        embedded_entries = [entry for entry in entries
+                            if entry.name.endswith('.gz') and entry.name + '.meta' not in names]
+        
+        if not metadata_paths and not embedded_entries:
+            return []
+        
+        # Leitura concorrente: o custo é dominado pela latência de disco de cada arquivo
+        workers = min(METADATA_READ_WORKERS, len(metadata_paths) + len(embedded_entries))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self._load_metadata_file, metadata_paths))
+            results.extend(executor.map(self._read_embedded_metadata, embedded_entries))
+            return [metadata for metadata in results if metadata is not None]
+    
+    def _load_metadata_file(self, metadata_path: str) -> Optional[Dict]:
+        """
+        Lê um arquivo .meta
+        
+        Args:
+            metadata_path (str): Caminho do arquivo de metadados
+            
+        Returns:
+            Optional[Dict]: Metadados ou None em caso de erro
+        """
+        try:
+            return JsonUtils.load(metadata_path)
+        except Exception as e:
+            self.logger.warning(f"Erro ao ler metadados de {os.path.basename(metadata_path)}: {e}")
+            return None
+    
+    def _load_index(self) -> List[Dict]:
+        """
+        Carrega o índice de backups, reconstruindo-o a partir dos .meta se não existir
+        
+        Returns:
+            List[Dict]: Metadados de todos os backups indexados
+        """
+        try:
+            index_mtime = os.stat(self._index_path).st_mtime_ns
+        except FileNotFoundError:
+            self.logger.debug("Índice de backups não encontrado, reconstruindo a partir dos arquivos de backup")
+            entries = self._scan_metadata_files()
+            self._write_index(entries)
+            return entries
+        
+        # Reutiliza o índice em memória enquanto o arquivo não mudar
+        if self._index_cache is not None and self._index_cache[0] == index_mtime:
+            return self._index_cache[1]
+        
+        try:
+            entries = JsonUtils.load(self._index_path)
+        except (ValueError, OSError) as e:
+            self.logger.warning(f"Índice de backups inválido, reconstruindo: {e}")
+            entries = self._scan_metadata_files()
+            self._write_index(entries)
+            return entries
+        
+        self._index_cache = (index_mtime, entries)
+        return entries
+    
+    def _write_index(self, entries: List[Dict]) -> None:
+        """
+        Grava o índice de backups de forma atômica
+        
+        Args:
+            entries (List[Dict]): Metadados de todos os backups
+        """
+        JsonUtils.dump(entries, self._index_path)
+        
+        self._index_cache = (os.stat(self._index_path).st_mtime_ns, entries)
     
     def list_backups(self) -> List[Dict]:
         """
@@ -305,16 +856,8 @@ class BackupManager:
         backups = []
         
         try:
-            for filename in os.listdir(self.backup_path):
-                if filename.endswith('.meta'):
-                    metadata_path = os.path.join(self.backup_path, filename)
-                    
-                    try:
-                        with open(metadata_path, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
-                            backups.append(metadata)
-                    except Exception as e:
-                        self.logger.warning(f"Erro ao ler metadados de {filename}: {e}")
+            # Cópias para que alterações feitas pelo chamador não afetem o índice em memória
+            backups = [dict(entry) for entry in self._load_index()]
             
             # Ordena por timestamp (mais recente primeiro)
             backups.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
@@ -339,28 +882,126 @@ class BackupManager:
                 return
             
             backups_to_remove = backups[keep_last:]
+            removed_files = set()
             
             for backup in backups_to_remove:
                 backup_path = backup.get('backup_path')
                 metadata_path = backup_path + '.meta' if backup_path else None
                 
                 try:
-                    if backup_path and os.path.exists(backup_path):
-                        os.remove(backup_path)
+                    # Remove direto (EAFP): evita os.path.exists antes de cada arquivo
+                    if backup_path and self._remove_file(backup_path):
                         self.logger.debug(f"Backup removido: {backup.get('backup_file')}")
                     
-                    if metadata_path and os.path.exists(metadata_path):
-                        os.remove(metadata_path)
+                    if metadata_path and self._remove_file(metadata_path):
                         self.logger.debug(f"Metadados removidos: {os.path.basename(metadata_path)}")
+                    
+                    removed_files.add(backup.get('backup_file'))
                         
                 except Exception as e:
                     self.logger.warning(f"Erro ao remover backup {backup.get('backup_file')}: {e}")
             
+            # Remove do índice os backups apagados
+            if removed_files:
+                with self._index_lock:
+                    self._write_index([entry for entry in self._load_index()
+                                       if entry.get('backup_file') not in removed_files])
+            
             self.logger.info(f"Limpeza de backups concluída: {len(backups_to_remove)} backups removidos")
             
         except Exception as e:
             self.logger.error(f"Erro na limpeza de backups: {e}")
     
+    @staticmethod
+    def _remove_file(filepath: str) -> bool:
+        """
+        Remove um arquivo ignorando se ele já não existir
+        
+        Args:
+            filepath (str): Caminho do arquivo
+            
+        Returns:
+            bool: True se o arquivo foi removido, False se não existia
+        """
+        try:
+            os.unlink(filepath)
+            return True
+        except FileNotFoundError:
+            return False
+    
+    def copy_table_data_to(self, target: "BackupManager", table_name: str,
+                           replace: bool = False) -> None:
+        """
+        Copia os dados de uma tabela para outro banco ligando mysqldump a mysql por pipe
+        
+        As linhas passam direto de um processo para o outro, sem atravessar o Python.
+        O dump inclui os ajustes de sessão do mysqldump (FKs e unicidade desabilitadas,
+        NO_AUTO_VALUE_ON_ZERO), então IDs iguais a 0 são preservados.
+        
+        Args:
+            target (BackupManager): Gerenciador do banco de destino (tabela já criada)
+            table_name (str): Nome da tabela
+            replace (bool): Gera REPLACE em vez de INSERT
+        """
+        dump_cmd = [
+            "mysqldump",
+            f"--defaults-extra-file={self._get_defaults_file()}",
+            "--no-create-info",
+            "--skip-triggers",
+            "--single-transaction",
+            "--quick",
+            "--lock-tables=false",
+            "--skip-add-locks",
+            "--extended-insert",
+            f"--net-buffer-length={self.net_buffer_length}",
+            f"--max-allowed-packet={self.max_allowed_packet}",
+            *self._get_wire_compression_args("mysqldump"),
+            *(["--replace"] if replace else []),
+            self.db_manager.config.dbname,
+            table_name
+        ]
+        
+        try:
+            dump = subprocess.Popen(
+                dump_cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                **PIPE_KWARGS
+            )
+            load = subprocess.Popen(
+                list(target._get_mysql_command()),
+                stdin=dump.stdout,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                universal_newlines=True,
+                **PIPE_KWARGS
+            )
+            dump.stdout.close()
+            
+            # Drena o stderr do mysqldump em paralelo enquanto o mysql carrega os dados
+            dump_stderr_chunks = []
+            dump_stderr_thread = threading.Thread(
+                target=lambda: dump_stderr_chunks.append(dump.stderr.read()),
+                daemon=True
+            )
+            dump_stderr_thread.start()
+            
+            stdout, stderr = load.communicate()
+            dump.wait()
+            dump_stderr_thread.join()
+            
+            if dump.returncode != 0:
+                dump_stderr = b''.join(dump_stderr_chunks).decode('utf-8', errors='replace')
+                raise BackupError(f"Erro no mysqldump: {dump_stderr}")
+            if load.returncode != 0:
+                raise BackupError(f"Erro no mysql client: {stderr}")
+            
+            self.logger.debug("Dados de %s copiados via mysqldump | mysql", table_name)
+            
+        except (OSError, subprocess.SubprocessError) as e:
+            self.logger.error(f"Erro ao copiar dados da tabela {table_name}: {e}")
+            raise BackupError(f"Falha na cópia de {table_name}: {e}")
+    
     def restore_backup(self, backup_filepath: str) -> None:
         """
         Restaura um backup do banco de dados
@@ -375,27 +1016,58 @@ class BackupManager:
             self.logger.info(f"Iniciando restauração do backup: {os.path.basename(backup_filepath)}")
             
             # Comando mysql para restaurar
-            mysql_cmd = [
-                "mysql",
-                f"--host={self.db_manager.config.host}",
-                f"--port={self.db_manager.config.port}",
-                f"--user={self.db_manager.config.username}",
-                f"--password={self.db_manager.config.password}",
-                self.db_manager.config.dbname
-            ]
+            mysql_cmd = list(self._get_mysql_command())
             
+            # Arquivo gerado pelo compressor externo: descomprime via pipe direto no mysql
+            if self._compressor_available and backup_filepath.endswith(self.compress_extension):
+                decompress = subprocess.Popen(
+                    self.compressor + ["-d", "-c", backup_filepath],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    **PIPE_KWARGS
+                )
+                process = subprocess.Popen(
+                    mysql_cmd,
+                    stdin=decompress.stdout,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    universal_newlines=True,
+                    **PIPE_KWARGS
+                )
+                decompress.stdout.close()
+                
+                # Drena o stderr do descompressor em paralelo enquanto o mysql restaura
+                decompress_stderr_chunks = []
+                decompress_stderr_thread = threading.Thread(
+                    target=lambda: decompress_stderr_chunks.append(decompress.stderr.read()),
+                    daemon=True
+                )
+                decompress_stderr_thread.start()
+                
+                stdout, stderr = process.communicate()
+                decompress.wait()
+                decompress_stderr_thread.join()
+                
+                if decompress.returncode != 0:
+                    decompress_stderr = b''.join(decompress_stderr_chunks).decode('utf-8', errors='replace')
+                    if process.returncode == 0:
+                        raise BackupError(
+                            f"Erro ao descomprimir backup com {self.compressor[0]}: {decompress_stderr}"
+                        )
+                    stderr = f"{stderr}\n{self.compressor[0]}: {decompress_stderr}"
             # Se o arquivo estiver comprimido
-            if backup_filepath.endswith('.gz'):
-                with gzip.open(backup_filepath, 'rt', encoding='utf-8') as f:
+            elif backup_filepath.endswith('.gz'):
+                with gzip.open(backup_filepath, 'rb') as f:
                     process = subprocess.Popen(
                         mysql_cmd,
                         stdin=subprocess.PIPE,
                         stdout=subprocess.PIPE,
                         stderr=subprocess.PIPE,
-                        universal_newlines=True
+                        **PIPE_KWARGS
                     )
                     
-                    stdout, stderr = process.communicate(input=f.read())
+                    stdout, stderr = stream_to_process(f, process)
+                    stderr = stderr.decode('utf-8', errors='replace')
             else:
                 with open(backup_filepath, 'r', encoding='utf-8') as f:
                     process = subprocess.Popen(
@@ -403,7 +1075,8 @@ class BackupManager:
                         stdin=f,
                         stdout=subprocess.PIPE,
                         stderr=subprocess.PIPE,
-                        universal_newlines=True
+                        universal_newlines=True,
+                        **PIPE_KWARGS
                     )
                     
                     stdout, stderr = process.communicate()
@@ -415,4 +1088,8 @@ class BackupManager:
             
         except Exception as e:
             self.logger.error(f"Erro ao restaurar backup: {e}")
-            raise BackupError(f"Falha na restauração: {e}")
\ No newline at end of file
+            raise BackupError(f"Falha na restauração: {e}")
+        finally:
+            # O schema pode ter mudado (mesmo em restauração parcial): descarta metadados em cache
+            if self.db_manager is not None:
+                self.db_manager.invalidate()
\ No newline at end of file
@@ -1,21 +1,36 @@
 """
 Módulo de configuração do sistema ReplicOOP
 """
-import json
 import os
-from typing import Dict, List, Any
+import sys
+from functools import cached_property
+from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
+from .utils import JsonUtils
 
-@dataclass
+
+# Chaves de nível superior do config.json que não são ambientes
+RESERVED_KEYS = ('maintain', 'settings')
+
+# Campos obrigatórios de cada ambiente
+REQUIRED_DATABASE_FIELDS = ('host', 'port', 'username', 'password', 'dbname')
+
+# slots=True só é suportado a partir do Python 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class DatabaseConfig:
-    """Configuração de conexão com banco de dados"""
+    """Configuração de conexão com banco de dados (imutável)"""
     host: str
     port: int
     username: str
     password: str
     dbname: str
     charset: str = "utf8"
+    # False usa a extensão C do mysql-connector (decodificação de pacotes em C)
+    use_pure: bool = False
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -24,7 +39,8 @@ class DatabaseConfig:
             'user': self.username,
             'password': self.password,
             'database': self.dbname,
-            'charset': self.charset
+            'charset': self.charset,
+            'use_pure': self.use_pure
         }
 
 
@@ -39,8 +55,16 @@ class ConfigManager:
             config_path (str): Caminho para o arquivo de configuração
         """
         self.config_path = config_path
-        self._config = None
-        self._load_config()
+        self._config_data = None
+        self._database_configs: Dict[str, DatabaseConfig] = {}
+        self._invalid_environments: Dict[str, str] = {}
+    
+    @property
+    def _config(self) -> Dict[str, Any]:
+        """Configurações carregadas do arquivo JSON (lidas no primeiro acesso)"""
+        if self._config_data is None:
+            self._load_config()
+        return self._config_data
     
     def _load_config(self) -> None:
         """Carrega as configurações do arquivo JSON"""
@@ -48,14 +72,70 @@ class ConfigManager:
             if not os.path.exists(self.config_path):
                 raise FileNotFoundError(f"Arquivo de configuração não encontrado: {self.config_path}")
             
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self._config = json.load(f)
+            config_data = JsonUtils.load(self.config_path)
+            self._build_database_configs(config_data)
+            self._config_data = config_data
                 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             raise ValueError(f"Erro ao decodificar arquivo de configuração: {e}")
         except Exception as e:
             raise Exception(f"Erro ao carregar configurações: {e}")
     
+    def _build_database_configs(self, config_data: Dict[str, Any]) -> None:
+        """
+        Valida todos os ambientes uma única vez e monta suas configurações imutáveis
+        
+        Ambientes inválidos não impedem o carregamento; o erro é reportado apenas
+        quando o ambiente for solicitado.
+        
+        Args:
+            config_data (Dict[str, Any]): Conteúdo do arquivo de configuração
+        """
+        if not isinstance(config_data, dict):
+            raise ValueError("O arquivo de configuração deve conter um objeto JSON")
+        
+        self._database_configs = {}
+        self._invalid_environments = {}
+        
+        for environment, env_config in config_data.items():
+            if environment in RESERVED_KEYS:
+                continue
+            
+            error = self._validate_environment(env_config)
+            if error:
+                self._invalid_environments[environment] = error
+                continue
+            
+            self._database_configs[environment] = DatabaseConfig(
+                host=env_config['host'],
+                port=env_config['port'],
+                username=env_config['username'],
+                password=env_config['password'],
+                dbname=env_config['dbname'],
+                charset=env_config.get('charset', 'utf8'),
+                use_pure=bool(env_config.get('use_pure', False))
+            )
+    
+    @staticmethod
+    def _validate_environment(env_config: Any) -> Optional[str]:
+        """
+        Valida a estrutura da configuração de um ambiente
+        
+        Args:
+            env_config (Any): Configuração do ambiente
+            
+        Returns:
+            Optional[str]: Descrição do erro ou None se válida
+        """
+        if not isinstance(env_config, dict):
+            return "configuração deve ser um objeto"
+        
+        missing = [field for field in REQUIRED_DATABASE_FIELDS if field not in env_config]
+        if missing:
+            return f"campos obrigatórios ausentes: {', '.join(missing)}"
+        
+        return None
+    
     def get_database_config(self, environment: str) -> DatabaseConfig:
         """
         Obtém configuração do banco de dados para um ambiente específico
@@ -66,18 +146,18 @@ class ConfigManager:
         Returns:
             DatabaseConfig: Configuração do banco de dados
         """
-        if environment not in self._config:
-            raise ValueError(f"Ambiente '{environment}' não encontrado na configuração")
+        if self._config_data is None:
+            self._load_config()
         
-        env_config = self._config[environment]
-        return DatabaseConfig(
-            host=env_config['host'],
-            port=env_config['port'],
-            username=env_config['username'],
-            password=env_config['password'],
-            dbname=env_config['dbname'],
-            charset=env_config.get('charset', 'utf8')
-        )
+        try:
+            return self._database_configs[environment]
+        except KeyError:
+            if environment in self._invalid_environments:
+                raise ValueError(
+                    f"Configuração inválida para o ambiente '{environment}': "
+                    f"{self._invalid_environments[environment]}"
+                )
+            raise ValueError(f"Ambiente '{environment}' não encontrado na configuração")
     
     def get_maintain_tables(self) -> List[str]:
         """
@@ -88,17 +168,72 @@ class ConfigManager:
         """
         return self._config.get('maintain', [])
     
-    def get_backup_path(self) -> str:
+    def get_settings(self) -> Dict[str, Any]:
         """
-        Obtém o caminho para armazenamento de backups
+        Obtém as configurações gerais opcionais do sistema (chave 'settings')
         
         Returns:
-            str: Caminho do diretório de backups
+            Dict[str, Any]: Configurações gerais
+        """
+        return self._config.get('settings', {})
+    
+    def get_write_buffer_size(self, default: int = 1 << 20) -> int:
+        """
+        Obtém o tamanho do buffer de escrita dos arquivos de backup
+        
+        Args:
+            default (int): Valor usado quando não configurado
+            
+        Returns:
+            int: Tamanho do buffer em bytes
+        """
+        return int(self.get_settings().get('write_buffer_size', default))
+    
+    def get_pool_size(self, default: int = 8) -> int:
+        """
+        Obtém o número de conexões mantidas no pool de cada banco
+        
+        Args:
+            default (int): Valor usado quando não configurado
+            
+        Returns:
+            int: Tamanho do pool de conexões
+        """
+        return int(self.get_settings().get('pool_size', default))
+    
+    def get_batch_size(self, default: int = 5000) -> int:
+        """
+        Obtém o número de linhas lidas e gravadas por lote na replicação de dados
+        
+        Args:
+            default (int): Valor usado quando não configurado
+            
+        Returns:
+            int: Linhas por lote
         """
+        return int(self.get_settings().get('batch_size', default))
+    
+    @cached_property
+    def _backup_path(self) -> str:
         backup_path = os.path.join(os.getcwd(), 'backups')
         os.makedirs(backup_path, exist_ok=True)
         return backup_path
     
+    @cached_property
+    def _logs_path(self) -> str:
+        logs_path = os.path.join(os.getcwd(), 'logs')
+        os.makedirs(logs_path, exist_ok=True)
+        return logs_path
+    
+    def get_backup_path(self) -> str:
+        """
+        Obtém o caminho para armazenamento de backups
+        
+        Returns:
+            str: Caminho do diretório de backups
+        """
+        return self._backup_path
+    
     def get_logs_path(self) -> str:
         """
         Obtém o caminho para armazenamento de logs
@@ -106,9 +241,7 @@ class ConfigManager:
         Returns:
             str: Caminho do diretório de logs
         """
-        logs_path = os.path.join(os.getcwd(), 'logs')
-        os.makedirs(logs_path, exist_ok=True)
-        return logs_path
+        return self._logs_path
     
     def get_available_environments(self) -> List[str]:
         """
@@ -118,5 +251,5 @@ class ConfigManager:
             List[str]: Lista de nomes dos ambientes configurados
         """
         environments = list(self._config.keys())
-        # Remove 'maintain' da lista se existir
-        return [env for env in environments if env != 'maintain']
\ No newline at end of file
+        # Remove 'maintain' e 'settings' da lista se existirem
+        return [env for env in environments if env not in RESERVED_KEYS]
\ No newline at end of file
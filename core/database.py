@@ -3,15 +3,234 @@ Módulo de conexão e operações com banco de dados MySQL
 """
 import mysql.connector
 from mysql.connector import Error as MySQLError
+from mysql.connector.errors import PoolError
+from mysql.connector.pooling import MySQLConnectionPool
 import pymysql
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Set, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
 from contextlib import contextmanager
+from datetime import timedelta
+from itertools import chain
+import hashlib
+import os
+import queue
+import re
+import shutil
+import tempfile
+import threading
 import time
 
 from .config import DatabaseConfig
 from .logger import LoggerManager
 
 
+# Tamanho padrão do pool de conexões por banco
+DEFAULT_POOL_SIZE = 8
+
+# INSERT/REPLACE simples com uma única tupla de placeholders, expansível para múltiplas linhas
+INSERT_VALUES_PATTERN = re.compile(
+    r"^\s*((?:INSERT|REPLACE)\s+INTO\s+`?\w+`?\s*(?:\([^)]*\))?\s*VALUES)\s*(\([^)]+\))\s*;?\s*$",
+    re.IGNORECASE
+)
+
+# Limites de cada INSERT multi-linha: linhas por comando e placeholders do protocolo MySQL
+MULTI_INSERT_MAX_ROWS = 1000
+MYSQL_MAX_PLACEHOLDERS = 65535
+
+# max_allowed_packet assumido quando o servidor não informa (padrão do MySQL 5.7)
+DEFAULT_MAX_ALLOWED_PACKET = 4 << 20
+
+# Cursores preparados mantidos por conexão durante um bulk_load (os mais antigos são fechados)
+PREPARED_CURSOR_CACHE_SIZE = 8
+
+# Ajustes de sessão para cargas em massa: uma transação, sem verificação de FKs e unicidade,
+# com IDs=0 preservados em colunas AUTO_INCREMENT (NO_AUTO_VALUE_ON_ZERO)
+BULK_LOAD_SESSION_SETUP = (
+    "SET SESSION autocommit = 0, FOREIGN_KEY_CHECKS = 0, UNIQUE_CHECKS = 0, "
+    "sql_mode = 'NO_AUTO_VALUE_ON_ZERO,NO_ENGINE_SUBSTITUTION'"
+)
+BULK_LOAD_SESSION_RESTORE = "SET SESSION FOREIGN_KEY_CHECKS = 1, UNIQUE_CHECKS = 1, autocommit = 1, sql_mode = DEFAULT"
+
+# Sequências de escape do formato padrão do LOAD DATA (FIELDS ESCAPED BY '\\')
+LOAD_DATA_ESCAPES = (
+    (b'\\', b'\\\\'),
+    (b'\t', b'\\t'),
+    (b'\n', b'\\n'),
+    (b'\r', b'\\r'),
+    (b'\x00', b'\\0'),
+)
+
+# Contador AUTO_INCREMENT do CREATE TABLE, ignorado ao comparar estruturas
+CREATE_TABLE_AUTO_INCREMENT_PATTERN = re.compile(r"\s+AUTO_INCREMENT=\d+", re.IGNORECASE)
+
+# Nome da tabela em um statement CREATE TABLE
+CREATE_TABLE_NAME_PATTERN = re.compile(
+    r"^\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?`((?:[^`]|``)+)`",
+    re.IGNORECASE
+)
+
+# Índice secundário comum (KEY) em uma linha do SHOW CREATE TABLE: (definição, nome, 1ª coluna)
+SECONDARY_INDEX_PATTERN = re.compile(
+    r"^\s*(KEY\s+`((?:[^`]|``)+)`\s*\(`((?:[^`]|``)+)`.*?),?\s*$",
+    re.MULTILINE
+)
+
+# Tamanho alvo (bytes) de cada bloco lido em streaming e linhas do primeiro bloco,
+# usado para medir o tamanho médio das linhas antes de ajustar os seguintes
+STREAM_BATCH_MAX_BYTES = 16 << 20
+STREAM_FIRST_BATCH_ROWS = 100
+
+# Linhas amostradas de cada bloco para estimar o tamanho médio
+ROW_SIZE_SAMPLE = 16
+
+# Lotes lidos antecipadamente pela thread de leitura enquanto o destino grava
+STREAM_PREFETCH_BATCHES = 4
+
+# Marcador de fim da leitura antecipada
+_PREFETCH_END = object()
+
+
+def _encode_load_data_value(value: Any, encoding: str) -> bytes:
+    """
+    Converte um valor para o formato de texto aceito pelo LOAD DATA
+    
+    Args:
+        value (Any): Valor lido do banco de origem
+        encoding (str): Codificação usada para textos
+        
+    Returns:
+        bytes: Valor escapado (NULL vira \\N)
+    """
+    if value is None:
+        return b'\\N'
+    if isinstance(value, (bytes, bytearray)):
+        data = bytes(value)
+    elif isinstance(value, bool):
+        data = b'1' if value else b'0'
+    elif isinstance(value, timedelta):
+        # Colunas TIME: str(timedelta) usaria o formato "1 day, 2:00:00"
+        micros = (value.days * 86400 + value.seconds) * 1000000 + value.microseconds
+        sign = '-' if micros < 0 else ''
+        seconds, micros = divmod(abs(micros), 1000000)
+        data = f"{sign}{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}.{micros:06d}".encode('ascii')
+    elif isinstance(value, (set, frozenset)):
+        # Colunas SET
+        data = ','.join(sorted(value)).encode(encoding)
+    else:
+        data = str(value).encode(encoding)
+    
+    for raw, escaped in LOAD_DATA_ESCAPES:
+        if raw in data:
+            data = data.replace(raw, escaped)
+    return data
+
+
+def _write_load_data_rows(data_file, row_batches: Iterator[List[Tuple]], encoding: str) -> None:
+    """
+    Grava blocos de linhas no formato padrão do LOAD DATA (campos separados por tab)
+    
+    Args:
+        data_file: Arquivo (ou pipe) aberto em modo binário
+        row_batches (Iterator[List[Tuple]]): Blocos de linhas
+        encoding (str): Codificação usada para textos
+    """
+    for batch in row_batches:
+        data_file.writelines(
+            b'\t'.join([_encode_load_data_value(value, encoding) for value in row]) + b'\n'
+            for row in batch
+        )
+
+
+def _release_fifo_writer(path: str, writer: threading.Thread) -> None:
+    """
+    Encerra a thread que escreve em um pipe nomeado cujo leitor não o abriu (ou abandonou)
+    
+    Abrir e fechar o lado de leitura desbloqueia o open() do escritor, que recebe
+    BrokenPipeError na escrita seguinte e termina.
+    
+    Args:
+        path (str): Caminho do pipe nomeado
+        writer (threading.Thread): Thread escritora
+    """
+    while writer.is_alive():
+        try:
+            os.close(os.open(path, os.O_RDONLY | os.O_NONBLOCK))
+        except OSError:
+            pass
+        writer.join(0.1)
+
+
+def _estimate_row_bytes(row: Tuple) -> int:
+    """
+    Estima o tamanho de uma linha (textos e binários pelo comprimento, demais como 8 bytes)
+    
+    Args:
+        row (Tuple): Linha de valores
+        
+    Returns:
+        int: Tamanho aproximado em bytes
+    """
+    return sum(len(v) if isinstance(v, (str, bytes, bytearray)) else 8 for v in row)
+
+
+def _prefetch_batches(batches: Iterator[List[Tuple]], depth: int) -> Iterator[List[Tuple]]:
+    """
+    Consome um iterador de lotes em uma thread própria, até depth lotes à frente
+    
+    Permite que a leitura da origem continue enquanto quem consome grava no destino.
+    Erros da leitura são relançados no consumidor; se o consumo for interrompido,
+    a thread de leitura é encerrada e o iterador original é fechado.
+    
+    Args:
+        batches (Iterator[List[Tuple]]): Lotes de origem
+        depth (int): Máximo de lotes aguardando consumo
+        
+    Yields:
+        List[Tuple]: Lotes na ordem original
+    """
+    buffer = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce() -> None:
+        try:
+            for batch in batches:
+                if not put(batch):
+                    return
+            put(_PREFETCH_END)
+        except BaseException as e:
+            put(e)
+        finally:
+            # Fecha o gerador na própria thread que o consumiu (libera a conexão de leitura)
+            close = getattr(batches, 'close', None)
+            if close:
+                close()
+    
+    producer = threading.Thread(target=produce, name="prefetch-batches", daemon=True)
+    producer.start()
+    
+    try:
+        while True:
+            item = buffer.get()
+            if item is _PREFETCH_END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
 class DatabaseConnectionError(Exception):
     """Exceção personalizada para erros de conexão com banco de dados"""
     pass
@@ -25,17 +244,60 @@ class DatabaseOperationError(Exception):
 class DatabaseManager:
     """Gerenciador de conexões e operações com banco de dados MySQL"""
     
-    def __init__(self, config: DatabaseConfig, logger: LoggerManager):
+    def __init__(self, config: DatabaseConfig, logger: LoggerManager,
+                 pool_size: int = DEFAULT_POOL_SIZE):
         """
         Inicializa o gerenciador de banco de dados
         
         Args:
             config (DatabaseConfig): Configuração de conexão
             logger (LoggerManager): Gerenciador de logs
+            pool_size (int): Número de conexões mantidas no pool
         """
         self.config = config
         self.logger = logger
+        self.pool_size = pool_size
         self._connection = None
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._max_allowed_packet = None
+        self._local_infile_supported = None
+        # Cache de metadados por tabela (invalidado em operações que alteram o schema)
+        self._structure_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._create_cache: Dict[str, str] = {}
+        self._fk_cache: Dict[str, List[Dict[str, str]]] = {}
+        self._tables_cache: Optional[List[str]] = None
+        # Conexão da sessão ativa (por thread), reutilizada por todas as chamadas
+        self._local = threading.local()
+    
+    @property
+    def _active_conn(self):
+        """Conexão aberta por session() na thread atual, se houver"""
+        return getattr(self._local, 'conn', None)
+    
+    @contextmanager
+    def session(self):
+        """
+        Context manager que mantém uma única conexão aberta para várias operações
+        
+        Dentro do bloco, todas as chamadas feitas pela mesma thread reutilizam
+        a mesma conexão em vez de obter uma nova a cada query.
+        
+        Yields:
+            mysql.connector.connection: Conexão compartilhada pela sessão
+        """
+        if self._active_conn is not None:
+            yield self._active_conn
+            return
+        
+        connection = self._create_connection()
+        self._local.conn = connection
+        try:
+            yield connection
+        finally:
+            self._local.conn = None
+            self._close_connection(connection)
+            self.logger.debug("Sessão com banco de dados encerrada")
     
     @contextmanager
     def get_connection(self):
@@ -45,6 +307,14 @@ class DatabaseManager:
         Yields:
             mysql.connector.connection: Conexão com o banco de dados
         """
+        if self._active_conn is not None:
+            try:
+                yield self._active_conn
+            except MySQLError as e:
+                self.logger.error(f"Erro na conexão com banco de dados: {e}")
+                raise DatabaseConnectionError(f"Erro na conexão: {e}")
+            return
+        
         connection = None
         try:
             connection = self._create_connection()
@@ -53,25 +323,94 @@ class DatabaseManager:
             self.logger.error(f"Erro na conexão com banco de dados: {e}")
             raise DatabaseConnectionError(f"Erro na conexão: {e}")
         finally:
-            if connection and connection.is_connected():
-                connection.close()
+            if connection is not None:
+                self._close_connection(connection)
                 self.logger.debug("Conexão com banco de dados fechada")
     
+    @staticmethod
+    def _close_connection(connection) -> None:
+        """
+        Fecha (ou devolve ao pool) uma conexão sem verificação prévia
+        
+        is_connected() faria um ping ao servidor a cada query; close() já é seguro
+        para conexões encerradas.
+        
+        Args:
+            connection: Conexão a fechar
+        """
+        try:
+            connection.close()
+        except Exception:
+            pass
+    
+    def _get_pool(self) -> MySQLConnectionPool:
+        """
+        Obtém o pool de conexões, criando-o no primeiro uso
+        
+        Returns:
+            MySQLConnectionPool: Pool de conexões do banco
+        """
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    # pool_reset_session=True: variáveis de sessão (FOREIGN_KEY_CHECKS, sql_mode)
+                    # não vazam entre usos, mantendo o comportamento de conexões independentes
+                    self._pool = MySQLConnectionPool(
+                        pool_name="replicoop",
+                        pool_size=self.pool_size,
+                        pool_reset_session=True,
+                        **self.config.to_dict()
+                    )
+                    self.logger.debug(f"Pool de {self.pool_size} conexões criado para {self.config.host}:{self.config.port}")
+        return self._pool
+    
     def _create_connection(self) -> mysql.connector.connection:
         """
-        Cria uma nova conexão com o banco de dados
+        Obtém uma conexão do pool (ou uma conexão avulsa se o pool estiver esgotado)
         
         Returns:
-            mysql.connector.connection: Nova conexão
+            mysql.connector.connection: Conexão com o banco de dados
         """
         try:
-            connection = mysql.connector.connect(**self.config.to_dict())
-            self.logger.debug(f"Conexão estabelecida com {self.config.host}:{self.config.port}")
+            try:
+                connection = self._get_pool().get_connection()
+            except PoolError:
+                # Pool esgotado (ex.: muitas threads simultâneas): usa conexão avulsa
+                connection = mysql.connector.connect(**self.config.to_dict())
+                self.logger.debug("Pool esgotado, conexão avulsa estabelecida com %s:%s", self.config.host, self.config.port)
+                return connection
+            
+            self.logger.debug("Conexão obtida do pool para %s:%s", self.config.host, self.config.port)
             return connection
         except MySQLError as e:
             self.logger.error(f"Falha ao conectar com banco de dados: {e}")
             raise DatabaseConnectionError(f"Falha na conexão: {e}")
     
+    def invalidate(self, table_name: Optional[str] = None) -> None:
+        """
+        Descarta metadados em cache (estrutura, CREATE TABLE, FKs e lista de tabelas)
+        
+        Args:
+            table_name (str, optional): Tabela a invalidar; None limpa o cache inteiro
+        """
+        self._tables_cache = None
+        if table_name is None:
+            self._structure_cache.clear()
+            self._create_cache.clear()
+            self._fk_cache.clear()
+        else:
+            self._structure_cache.pop(table_name, None)
+            self._create_cache.pop(table_name, None)
+            self._fk_cache.pop(table_name, None)
+    
+    def close_pool(self) -> None:
+        """Fecha todas as conexões ociosas do pool"""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool._remove_connections()
+                self._pool = None
+                self.logger.debug("Pool de conexões encerrado")
+    
     def test_connection(self) -> bool:
         """
         Testa a conexão com o banco de dados
@@ -90,8 +429,8 @@ class DatabaseManager:
             self.logger.error(f"Teste de conexão falhou: {e}")
             return False
     
-    def execute_query(self, query: str, params: Optional[Tuple] = None, 
-                     fetch_results: bool = True) -> Optional[List[Tuple]]:
+    def _execute_query(self, query: str, params: Optional[Tuple], fetch_results: bool,
+                       dictionary: bool) -> Optional[List[Any]]:
         """
         Executa uma query no banco de dados
         
@@ -99,13 +438,14 @@ class DatabaseManager:
             query (str): Query SQL a ser executada
             params (Tuple, optional): Parâmetros para a query
             fetch_results (bool): Se deve retornar os resultados da query
+            dictionary (bool): Se as linhas devem ser retornadas como dicionários
             
         Returns:
-            Optional[List[Tuple]]: Resultados da query se fetch_results=True
+            Optional[List[Any]]: Resultados da query se fetch_results=True
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = conn.cursor(dictionary=dictionary)
                 
                 if params:
                     cursor.execute(query, params)
@@ -114,36 +454,263 @@ class DatabaseManager:
                 
                 if fetch_results:
                     results = cursor.fetchall()
-                    self.logger.debug(f"Query executada com {len(results)} resultados")
+                    self.logger.debug("Query executada com %d resultados", len(results))
                     return results
                 else:
                     conn.commit()
-                    self.logger.debug(f"Query executada, {cursor.rowcount} linhas afetadas")
+                    self.logger.debug("Query executada, %d linhas afetadas", cursor.rowcount)
                     return None
                     
         except MySQLError as e:
             self.logger.error(f"Erro ao executar query: {e}")
             raise DatabaseOperationError(f"Erro na execução: {e}")
     
-    def execute_many_query(self, query: str, params_list: List[Tuple]) -> None:
+    def execute_query_tuples(self, query: str, params: Optional[Tuple] = None, 
+                             fetch_results: bool = True) -> Optional[List[Tuple]]:
+        """
+        Executa uma query no banco de dados e retorna resultados como tuplas
+        
+        Args:
+            query (str): Query SQL a ser executada
+            params (Tuple, optional): Parâmetros para a query
+            fetch_results (bool): Se deve retornar os resultados da query
+            
+        Returns:
+            Optional[List[Tuple]]: Resultados da query se fetch_results=True
+        """
+        return self._execute_query(query, params, fetch_results, dictionary=False)
+    
+    def execute_query_dicts(self, query: str, params: Optional[Tuple] = None, 
+                            fetch_results: bool = True) -> Optional[List[Dict]]:
+        """
+        Executa uma query no banco de dados e retorna resultados como dicionários
+        
+        Args:
+            query (str): Query SQL a ser executada
+            params (Tuple, optional): Parâmetros para a query
+            fetch_results (bool): Se deve retornar os resultados da query
+            
+        Returns:
+            Optional[List[Dict]]: Resultados da query como dicionários se fetch_results=True
+        """
+        return self._execute_query(query, params, fetch_results, dictionary=True)
+    
+    # Mantém a API anterior: execute_query retorna dicionários
+    execute_query = execute_query_dicts
+    
+    def execute_many_query(self, query: str, params_list: List[Tuple], conn=None,
+                           prepared: bool = False) -> None:
         """
         Executa uma query com múltiplos conjuntos de parâmetros (batch insert)
         
+        INSERTs simples são reescritos como INSERT ... VALUES (...),(...) em blocos
+        que respeitam o max_allowed_packet e o limite de placeholders do MySQL,
+        todos confirmados em uma única transação.
+        
         Args:
             query (str): Query SQL a ser executada
             params_list (List[Tuple]): Lista de parâmetros para cada execução
+            conn (optional): Conexão de um bulk_load(); nesse caso o commit fica a
+                cargo do bloco bulk_load
+            prepared (bool): Usa prepared statements no servidor (o comando de cada
+                bloco completo é preparado uma vez e reutilizado)
         """
+        if not params_list:
+            return
+        
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.executemany(query, params_list)
-                conn.commit()
-                self.logger.debug(f"Batch query executada: {cursor.rowcount} linhas afetadas")
+            if conn is not None:
+                affected = self._execute_many(conn, query, params_list, prepared)
+            else:
+                with self.get_connection() as conn:
+                    affected = self._execute_many(conn, query, params_list, prepared)
+                    conn.commit()
+            
+            self.logger.debug("Batch query executada: %d linhas afetadas", affected)
                     
         except MySQLError as e:
             self.logger.error(f"Erro ao executar batch query: {e}")
             raise DatabaseOperationError(f"Erro na execução em batch: {e}")
     
+    def _execute_many(self, conn, query: str, params_list: List[Tuple],
+                      prepared: bool = False) -> int:
+        """
+        Envia o lote de parâmetros em uma conexão, sem confirmar a transação
+        
+        Args:
+            conn: Conexão ativa
+            query (str): Query SQL a ser executada
+            params_list (List[Tuple]): Lista de parâmetros para cada execução
+            prepared (bool): Usa um cursor de prepared statements
+            
+        Returns:
+            int: Linhas afetadas
+        """
+        # Dentro de um bulk_load nesta conexão, os cursores preparados ficam em cache
+        # entre chamadas: cada comando é preparado no servidor uma única vez
+        cached_cursors = prepared and self._get_prepared_cursor_cache(conn) is not None
+        
+        # O cursor preparado só prepara de novo quando o texto do comando muda
+        cursor = None
+        if not cached_cursors:
+            cursor = conn.cursor(prepared=True) if prepared else conn.cursor()
+        match = INSERT_VALUES_PATTERN.match(query)
+        
+        try:
+            if not match:
+                if cached_cursors:
+                    cursor = self._get_prepared_cursor(conn, query)
+                cursor.executemany(query, params_list)
+                return cursor.rowcount
+            
+            prefix, row_placeholders = match.groups()
+            chunk_len = self._get_multi_insert_chunk_size(conn, params_list)
+            affected = 0
+            
+            full_chunk_query = f"{prefix} {','.join([row_placeholders] * chunk_len)}"
+            
+            for start in range(0, len(params_list), chunk_len):
+                chunk = params_list[start:start + chunk_len]
+                if len(chunk) == chunk_len:
+                    chunk_query = full_chunk_query
+                else:
+                    chunk_query = f"{prefix} {','.join([row_placeholders] * len(chunk))}"
+                if cached_cursors:
+                    cursor = self._get_prepared_cursor(conn, chunk_query)
+                cursor.execute(chunk_query, list(chain.from_iterable(chunk)))
+                affected += cursor.rowcount
+            
+            return affected
+        finally:
+            if prepared and not cached_cursors and cursor is not None:
+                # Libera o prepared statement no servidor antes de devolver a conexão
+                cursor.close()
+    
+    def _get_prepared_cursor_cache(self, conn) -> Optional["OrderedDict[str, Any]"]:
+        """
+        Obtém o cache de cursores preparados do bulk_load ativo nesta thread
+        
+        Args:
+            conn: Conexão em uso
+            
+        Returns:
+            OrderedDict: Cursores por texto do comando, ou None fora de um bulk_load desta conexão
+        """
+        cache = getattr(self._local, 'prepared_cursors', None)
+        if cache is None or cache[0] is not conn:
+            return None
+        return cache[1]
+    
+    def _get_prepared_cursor(self, conn, query: str):
+        """
+        Obtém (ou cria) o cursor preparado de um comando, em um cache LRU por conexão
+        
+        Args:
+            conn: Conexão do bulk_load ativo
+            query (str): Texto do comando
+            
+        Returns:
+            Cursor preparado para o comando
+        """
+        cursors = self._get_prepared_cursor_cache(conn)
+        cursor = cursors.get(query)
+        
+        if cursor is not None:
+            cursors.move_to_end(query)
+            return cursor
+        
+        cursor = conn.cursor(prepared=True)
+        cursors[query] = cursor
+        
+        if len(cursors) > PREPARED_CURSOR_CACHE_SIZE:
+            _, oldest = cursors.popitem(last=False)
+            oldest.close()
+        
+        return cursor
+    
+    @contextmanager
+    def bulk_load(self, disable_binlog: bool = False):
+        """
+        Context manager para cargas em massa em uma única conexão e transação
+        
+        Desativa autocommit, FOREIGN_KEY_CHECKS e UNIQUE_CHECKS na sessão e faz um
+        único COMMIT ao final (ROLLBACK em caso de erro). Use a conexão retornada
+        com execute_many_query(..., conn=conn); com prepared=True, os cursores
+        preparados são reutilizados entre chamadas até o fim do bloco.
+        
+        Args:
+            disable_binlog (bool): Também desativa sql_log_bin (requer privilégio e
+                impede que réplicas do destino recebam os dados)
+            
+        Yields:
+            mysql.connector.connection: Conexão configurada para a carga
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(BULK_LOAD_SESSION_SETUP)
+            
+            if disable_binlog:
+                try:
+                    cursor.execute("SET SESSION sql_log_bin = 0")
+                except MySQLError as e:
+                    self.logger.debug("sql_log_bin não pôde ser desativado: %s", e)
+            
+            self._local.prepared_cursors = (conn, OrderedDict())
+            
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                # Libera os prepared statements no servidor antes de devolver a conexão
+                _, prepared_cursors = self._local.prepared_cursors
+                del self._local.prepared_cursors
+                for prepared_cursor in prepared_cursors.values():
+                    try:
+                        prepared_cursor.close()
+                    except MySQLError:
+                        pass
+                
+                try:
+                    cursor.execute(BULK_LOAD_SESSION_RESTORE)
+                    if disable_binlog:
+                        cursor.execute("SET SESSION sql_log_bin = 1")
+                except MySQLError:
+                    pass
+    
+    def _get_multi_insert_chunk_size(self, conn, params_list: List[Tuple]) -> int:
+        """
+        Calcula quantas linhas cabem em cada INSERT multi-linha
+        
+        Args:
+            conn: Conexão ativa (usada para ler o max_allowed_packet uma única vez)
+            params_list (List[Tuple]): Linhas a inserir
+            
+        Returns:
+            int: Número de linhas por comando
+        """
+        if self._max_allowed_packet is None:
+            try:
+                cursor = conn.cursor()
+                cursor.execute("SELECT @@max_allowed_packet")
+                self._max_allowed_packet = int(cursor.fetchone()[0])
+            except (MySQLError, TypeError, ValueError):
+                self._max_allowed_packet = DEFAULT_MAX_ALLOWED_PACKET
+        
+        # Estima o tamanho de uma linha pela primeira, com margem para escape e separadores
+        first_row = params_list[0]
+        n_columns = max(len(first_row), 1)
+        row_bytes = _estimate_row_bytes(first_row) * 2 + n_columns * 4
+        
+        # Reserva metade do pacote como margem para linhas maiores que a amostra
+        return max(1, min(
+            MULTI_INSERT_MAX_ROWS,
+            (self._max_allowed_packet // 2) // max(row_bytes, 1),
+            MYSQL_MAX_PLACEHOLDERS // n_columns
+        ))
+    
     def set_zero_preserve_mode(self, enable: bool = True) -> None:
         """
         Configura o modo SQL para preservar valores 0 em colunas AUTO_INCREMENT
@@ -153,13 +720,14 @@ class DatabaseManager:
         """
         try:
             if enable:
-                # Configurações específicas para preservar IDs com valor 0
-                self.execute_query("SET SESSION sql_mode = ''", fetch_results=False)  # Remove todas as restrições
-                self.execute_query("SET SESSION SQL_MODE = 'ALLOW_INVALID_DATES,NO_ENGINE_SUBSTITUTION'", fetch_results=False)
-                self.execute_query("SET @@SESSION.sql_mode = 'NO_ENGINE_SUBSTITUTION'", fetch_results=False)
-                # Força o comportamento desejado em AUTO_INCREMENT
-                self.execute_query("SET @@auto_increment_offset = 1", fetch_results=False)
-                self.execute_query("SET @@auto_increment_increment = 1", fetch_results=False)
+                # Configurações específicas para preservar IDs com valor 0, em um único comando:
+                # sql_mode sem restrições (apenas NO_ENGINE_SUBSTITUTION) e AUTO_INCREMENT sequencial
+                self.execute_query(
+                    "SET SESSION sql_mode = 'NO_ENGINE_SUBSTITUTION', "
+                    "@@SESSION.auto_increment_offset = 1, "
+                    "@@SESSION.auto_increment_increment = 1",
+                    fetch_results=False
+                )
                 self.logger.debug("Modo SQL configurado para preservar valores 0 em AUTO_INCREMENT")
             else:
                 # Restaura modo padrão do MySQL/MariaDB
@@ -168,41 +736,6 @@ class DatabaseManager:
         except Exception as e:
             self.logger.warning(f"Erro ao configurar modo SQL: {e}")
     
-    def execute_query(self, query: str, params: Optional[Tuple] = None, 
-                     fetch_results: bool = True) -> Optional[List[Dict]]:
-        """
-        Executa uma query no banco de dados e retorna resultados como dicionários
-        
-        Args:
-            query (str): Query SQL a ser executada
-            params (Tuple, optional): Parâmetros para a query
-            fetch_results (bool): Se deve retornar os resultados da query
-            
-        Returns:
-            Optional[List[Dict]]: Resultados da query como dicionários se fetch_results=True
-        """
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor(dictionary=True)  # Retorna dicionários
-                
-                if params:
-                    cursor.execute(query, params)
-                else:
-                    cursor.execute(query)
-                
-                if fetch_results:
-                    results = cursor.fetchall()
-                    self.logger.debug(f"Query executada com {len(results)} resultados")
-                    return results
-                else:
-                    conn.commit()
-                    self.logger.debug(f"Query executada, {cursor.rowcount} linhas afetadas")
-                    return None
-                    
-        except MySQLError as e:
-            self.logger.error(f"Erro ao executar query: {e}")
-            raise DatabaseOperationError(f"Erro na execução: {e}")
-    
     def get_table_columns(self, table_name: str) -> List[Dict[str, str]]:
         """
         Obtém informações das colunas de uma tabela
@@ -213,58 +746,43 @@ class DatabaseManager:
         Returns:
             List[Dict[str, str]]: Lista com informações das colunas
         """
-        query = f"DESCRIBE `{table_name}`"
-        results = self.execute_query(query)
+        results = self.get_table_structure(table_name)
         
-        if not results:
-            return []
-        
-        columns = []
-        for row in results:
-            columns.append({
+        return [
+            {
                 'name': row['Field'],
                 'type': row['Type'],
                 'null': row['Null'],
                 'key': row['Key'],
                 'default': row['Default'],
                 'extra': row['Extra']
-            })
-        
-        return columns
+            }
+            for row in results
+        ]
     
-    def get_tables(self) -> List[str]:
+    def get_tables(self, cached: bool = False) -> List[str]:
         """
         Obtém lista de todas as tabelas do banco de dados
         
+        Args:
+            cached (bool): Reutiliza a última lista obtida, se ainda válida
+                (descartada por invalidate() e por comandos que alteram o banco)
+        
         Returns:
             List[str]: Lista com nomes das tabelas
         """
+        if cached and self._tables_cache is not None:
+            return list(self._tables_cache)
+        
         try:
             query = "SHOW TABLES"
-            results = self.execute_query(query)
-            
-            if not results:
-                return []
+            results = self.execute_query_tuples(query)
             
-            # Trata diferentes formatos de resultado
-            tables = []
-            for row in results:
-                if isinstance(row, (list, tuple)) and len(row) > 0:
-                    # Formato tupla/lista: ('table_name',)
-                    tables.append(row[0])
-                elif isinstance(row, dict):
-                    # Formato dicionário: {'Tables_in_dbname': 'table_name'}
-                    # Pega o primeiro (e geralmente único) valor do dict
-                    table_name = list(row.values())[0]
-                    tables.append(table_name)
-                elif isinstance(row, str):
-                    # Formato string direta
-                    tables.append(row)
-                else:
-                    self.logger.warning(f"Formato inesperado na resposta SHOW TABLES: {type(row)} - {row}")
+            tables = [row[0] for row in results] if results else []
+            self._tables_cache = tables
             
-            self.logger.debug(f"Encontradas {len(tables)} tabelas: {tables}")
-            return tables
+            self.logger.debug("Encontradas %d tabelas: %s", len(tables), tables)
+            return list(tables)
             
         except Exception as e:
             self.logger.error(f"Erro ao obter lista de tabelas: {e}")
@@ -275,7 +793,7 @@ class DatabaseManager:
                 FROM information_schema.tables 
                 WHERE table_schema = %s
                 """
-                results = self.execute_query(query, (self.config.dbname,))
+                results = self.execute_query_tuples(query, (self.config.dbname,))
                 return [table[0] for table in results] if results else []
             except Exception as e2:
                 self.logger.error(f"Erro no método alternativo: {e2}")
@@ -297,19 +815,12 @@ class DatabaseManager:
             FROM information_schema.tables 
             WHERE table_schema = %s AND table_name = %s
             """
-            results = self.execute_query(query, (self.config.dbname, table_name))
-            
-            if results and len(results) > 0:
-                count = results[0]
-                # Trata diferentes formatos de resultado
-                if isinstance(count, (list, tuple)):
-                    exists = count[0] > 0
-                elif isinstance(count, dict):
-                    exists = list(count.values())[0] > 0
-                else:
-                    exists = count > 0
+            results = self.execute_query_tuples(query, (self.config.dbname, table_name))
+            
+            if results:
+                exists = results[0][0] > 0
                 
-                self.logger.debug(f"Tabela '{table_name}' {'existe' if exists else 'não existe'}")
+                self.logger.debug("Tabela '%s' %s", table_name, 'existe' if exists else 'não existe')
                 return exists
             
             return False
@@ -326,6 +837,38 @@ class DatabaseManager:
                 self.logger.error(f"Erro no método alternativo de verificação: {e2}")
                 return False
     
+    def tables_exist(self, table_names: List[str]) -> Set[str]:
+        """
+        Verifica a existência de várias tabelas com uma única consulta
+        
+        Args:
+            table_names (List[str]): Nomes das tabelas
+            
+        Returns:
+            Set[str]: Nomes das tabelas que existem no banco
+        """
+        if not table_names:
+            return set()
+        
+        try:
+            placeholders = ",".join(["%s"] * len(table_names))
+            query = f"""
+            SELECT table_name
+            FROM information_schema.tables 
+            WHERE table_schema = %s AND table_name IN ({placeholders})
+            """
+            results = self.execute_query_tuples(query, (self.config.dbname, *table_names))
+            
+            existing = {row[0] for row in results or []}
+            
+            self.logger.debug(f"{len(existing)} de {len(table_names)} tabelas existem")
+            return existing
+            
+        except Exception as e:
+            self.logger.warning(f"Erro ao verificar existência das tabelas: {e}")
+            # Método alternativo: lista as tabelas do banco
+            return set(self.get_tables()).intersection(table_names)
+    
     def get_table_structure(self, table_name: str) -> List[Dict[str, Any]]:
         """
         Obtém estrutura de uma tabela específica
@@ -336,30 +879,86 @@ class DatabaseManager:
         Returns:
             List[Dict[str, Any]]: Estrutura da tabela
         """
+        cached = self._structure_cache.get(table_name)
+        if cached is not None:
+            return cached
+        
         query = f"DESCRIBE `{table_name}`"
         results = self.execute_query(query)
         
         if not results:
             return []
         
-        columns = []
-        for row in results:
-            if isinstance(row, (list, tuple)) and len(row) >= 6:
-                # Formato tupla: (field, type, null, key, default, extra)
-                columns.append({
-                    'Field': row[0],
-                    'Type': row[1],
-                    'Null': row[2],
-                    'Key': row[3],
-                    'Default': row[4],
-                    'Extra': row[5]
-                })
-            elif isinstance(row, dict):
-                # Formato dict: {'Field': 'id', 'Type': 'int', ...}
-                columns.append(row)
+        # Todas as linhas do resultado têm o mesmo formato: verifica apenas a primeira
+        if isinstance(results[0], dict):
+            # Formato dict: {'Field': 'id', 'Type': 'int', ...}
+            self._structure_cache[table_name] = results
+            return results
         
+        # Formato tupla: (field, type, null, key, default, extra)
+        columns = [
+            {
+                'Field': row[0],
+                'Type': row[1],
+                'Null': row[2],
+                'Key': row[3],
+                'Default': row[4],
+                'Extra': row[5]
+            }
+            for row in results
+        ]
+        self._structure_cache[table_name] = columns
         return columns
     
+    def get_table_structures_bulk(self, table_names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Obtém a estrutura de várias tabelas com uma única consulta ao information_schema
+        
+        Args:
+            table_names (List[str]): Nomes das tabelas
+            
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Estrutura de cada tabela no formato do DESCRIBE
+                (tabelas inexistentes não aparecem no resultado)
+        """
+        missing = [table for table in dict.fromkeys(table_names) if table not in self._structure_cache]
+        
+        if missing:
+            placeholders = ",".join(["%s"] * len(missing))
+            query = f"""
+            SELECT 
+                TABLE_NAME,
+                COLUMN_NAME,
+                COLUMN_TYPE,
+                IS_NULLABLE,
+                COLUMN_KEY,
+                COLUMN_DEFAULT,
+                EXTRA
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = %s
+            AND TABLE_NAME IN ({placeholders})
+            ORDER BY TABLE_NAME, ORDINAL_POSITION
+            """
+            results = self.execute_query_tuples(query, (self.config.dbname, *missing))
+            
+            structures = {}
+            for row in results or []:
+                structures.setdefault(row[0], []).append({
+                    'Field': row[1],
+                    'Type': row[2],
+                    'Null': row[3],
+                    'Key': row[4],
+                    'Default': row[5],
+                    'Extra': row[6]
+                })
+            self._structure_cache.update(structures)
+        
+        return {
+            table: self._structure_cache[table]
+            for table in table_names
+            if table in self._structure_cache
+        }
+    
     def get_create_table_statement(self, table_name: str) -> str:
         """
         Obtém o statement CREATE TABLE para uma tabela
@@ -370,32 +969,181 @@ class DatabaseManager:
         Returns:
             str: Statement CREATE TABLE
         """
+        cached = self._create_cache.get(table_name)
+        if cached is not None:
+            return cached
+        
         query = f"SHOW CREATE TABLE `{table_name}`"
-        results = self.execute_query(query)
+        results = self.execute_query_tuples(query)
         
-        if results and len(results) > 0:
-            row = results[0]
-            # Trata diferentes formatos de retorno
-            if isinstance(row, (list, tuple)) and len(row) > 1:
-                # Formato tupla: ('table_name', 'CREATE TABLE ...')
-                return row[1]
-            elif isinstance(row, dict):
-                # Formato dicionário: {'Table': 'table_name', 'Create Table': 'CREATE TABLE ...'}
-                create_key = None
-                for key in row.keys():
-                    if 'create' in key.lower() and 'table' in key.lower():
-                        create_key = key
-                        break
-                if create_key:
-                    return row[create_key]
-                else:
-                    # Se não encontrar, pega o segundo valor
-                    values = list(row.values())
-                    if len(values) > 1:
-                        return values[1]
+        # Formato tupla: ('table_name', 'CREATE TABLE ...')
+        if results and len(results[0]) > 1:
+            self._create_cache[table_name] = results[0][1]
+            return results[0][1]
             
         raise DatabaseOperationError(f"Não foi possível obter CREATE TABLE para {table_name}")
     
+    def get_structure_fingerprint(self, table_name: str,
+                                  create_statement: Optional[str] = None) -> str:
+        """
+        Calcula o hash da estrutura de uma tabela a partir do CREATE TABLE
+        
+        O contador AUTO_INCREMENT e diferenças de espaçamento são ignorados, então
+        tabelas com a mesma definição têm o mesmo hash em bancos diferentes.
+        
+        Args:
+            table_name (str): Nome da tabela
+            create_statement (str, optional): CREATE TABLE já obtido (evita nova consulta)
+            
+        Returns:
+            str: Hash SHA-256 da estrutura normalizada
+        """
+        statement = create_statement or self.get_create_table_statement(table_name)
+        normalized = " ".join(CREATE_TABLE_AUTO_INCREMENT_PATTERN.sub("", statement).split())
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+    
+    def get_table_size(self, table_name: str) -> int:
+        """
+        Obtém o tamanho aproximado dos dados de uma tabela (estatística do information_schema)
+        
+        Args:
+            table_name (str): Nome da tabela
+            
+        Returns:
+            int: Tamanho dos dados em bytes (0 se desconhecido)
+        """
+        query = """
+        SELECT DATA_LENGTH
+        FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
+        """
+        results = self.execute_query_tuples(query, (self.config.dbname, table_name))
+        return int(results[0][0] or 0) if results else 0
+    
+    def get_table_row_estimate(self, table_name: str) -> int:
+        """
+        Obtém o número aproximado de linhas de uma tabela (estatística do information_schema)
+        
+        Args:
+            table_name (str): Nome da tabela
+            
+        Returns:
+            int: Número estimado de linhas (0 se desconhecido)
+        """
+        query = """
+        SELECT TABLE_ROWS
+        FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
+        """
+        results = self.execute_query_tuples(query, (self.config.dbname, table_name))
+        return int(results[0][0] or 0) if results else 0
+    
+    def get_table_checksums(self, tables: List[str]) -> Dict[str, Optional[int]]:
+        """
+        Obtém o CHECKSUM TABLE de várias tabelas com um único comando
+        
+        Args:
+            tables (List[str]): Nomes das tabelas
+            
+        Returns:
+            Dict[str, Optional[int]]: Checksum dos dados por tabela (None se indisponível)
+        """
+        if not tables:
+            return {}
+        
+        tables_sql = ", ".join(f"`{table}`" for table in tables)
+        results = self.execute_query_tuples(f"CHECKSUM TABLE {tables_sql}")
+        
+        # Formato tupla: ('banco.tabela', checksum)
+        return {row[0].split('.', 1)[-1]: row[1] for row in results}
+    
+    def compute_content_hash(self, table_name: str, columns: List[str]) -> Tuple[int, int, int]:
+        """
+        Calcula um hash do conteúdo de uma tabela com uma única consulta agregada
+        
+        Cada linha vira um CRC32 das colunas (com marcador de NULL); o resultado
+        independe da ordem das linhas e do formato de armazenamento do servidor.
+        
+        Args:
+            table_name (str): Nome da tabela
+            columns (List[str]): Colunas a considerar, na mesma ordem nos dois bancos
+            
+        Returns:
+            Tuple[int, int, int]: (linhas, XOR dos CRC32, soma dos CRC32)
+        """
+        row_sql = ", ".join(f"`{col}`, ISNULL(`{col}`)" for col in columns)
+        query = (
+            f"SELECT COUNT(*), COALESCE(BIT_XOR(CRC32(CONCAT_WS('|', {row_sql}))), 0), "
+            f"COALESCE(SUM(CRC32(CONCAT_WS('|', {row_sql}))), 0) FROM `{table_name}`"
+        )
+        results = self.execute_query_tuples(query)
+        count, xor_hash, sum_hash = results[0]
+        return int(count), int(xor_hash), int(sum_hash)
+    
+    def table_fingerprint(self, table_name: str) -> Tuple[str, Optional[int]]:
+        """
+        Obtém a impressão digital de uma tabela: hash da estrutura e checksum dos dados
+        
+        Args:
+            table_name (str): Nome da tabela
+            
+        Returns:
+            Tuple[str, Optional[int]]: (hash da estrutura, checksum dos dados)
+        """
+        checksum = self.get_table_checksums([table_name]).get(table_name)
+        return self.get_structure_fingerprint(table_name), checksum
+    
+    def describe_tables_parallel(self, tables: List[str],
+                                 workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Obtém estrutura, CREATE TABLE e FKs de várias tabelas em paralelo
+        
+        Cada thread usa sua própria conexão do pool (via session()) durante a
+        descrição de uma tabela. Tabelas que falharem são omitidas do resultado.
+        
+        Args:
+            tables (List[str]): Nomes das tabelas
+            workers (int, optional): Número de threads (padrão: tamanho do pool)
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Por tabela, as chaves 'structure',
+                'create_statement' e 'foreign_keys'
+        """
+        if not tables:
+            return {}
+        
+        max_workers = max(1, min(workers or self.pool_size, len(tables)))
+        descriptions = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._describe_one, table): table for table in tables}
+            for future in as_completed(futures):
+                table = futures[future]
+                try:
+                    descriptions[table] = future.result()
+                except Exception as e:
+                    self.logger.warning(f"Erro ao descrever tabela {table}: {e}")
+        
+        self.logger.debug(f"{len(descriptions)} de {len(tables)} tabelas descritas em paralelo")
+        return descriptions
+    
+    def _describe_one(self, table_name: str) -> Dict[str, Any]:
+        """
+        Obtém estrutura, CREATE TABLE e FKs de uma tabela usando uma única conexão
+        
+        Args:
+            table_name (str): Nome da tabela
+            
+        Returns:
+            Dict[str, Any]: Descrição da tabela
+        """
+        with self.session():
+            return {
+                'structure': self.get_table_structure(table_name),
+                'create_statement': self.get_create_table_statement(table_name),
+                'foreign_keys': self.get_foreign_keys(table_name)
+            }
+    
     def get_foreign_keys(self, table_name: str) -> List[Dict[str, str]]:
         """
         Obtém as chaves estrangeiras de uma tabela
@@ -406,41 +1154,71 @@ class DatabaseManager:
         Returns:
             List[Dict[str, str]]: Lista de chaves estrangeiras
         """
-        query = """
+        return self.get_foreign_keys_bulk([table_name]).get(table_name, [])
+    
+    def get_foreign_keys_bulk(self, table_names: List[str]) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Obtém as chaves estrangeiras de várias tabelas com uma única consulta
+        
+        Args:
+            table_names (List[str]): Nomes das tabelas
+            
+        Returns:
+            Dict[str, List[Dict[str, str]]]: Chaves estrangeiras agrupadas por tabela
+                (tabelas sem FKs não aparecem no resultado)
+        """
+        if not table_names:
+            return {}
+        
+        # Consulta apenas as tabelas que ainda não estão em cache
+        missing = [table for table in dict.fromkeys(table_names) if table not in self._fk_cache]
+        if missing:
+            self._fk_cache.update(self._fetch_foreign_keys(missing))
+        
+        return {
+            table: self._fk_cache[table]
+            for table in table_names
+            if self._fk_cache.get(table)
+        }
+    
+    def _fetch_foreign_keys(self, table_names: List[str]) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Consulta as chaves estrangeiras de várias tabelas no information_schema
+        
+        Args:
+            table_names (List[str]): Nomes das tabelas
+            
+        Returns:
+            Dict[str, List[Dict[str, str]]]: Chaves estrangeiras de cada tabela
+                (lista vazia para tabelas sem FKs)
+        """
+        placeholders = ",".join(["%s"] * len(table_names))
+        query = f"""
         SELECT 
+            TABLE_NAME,
             CONSTRAINT_NAME,
             COLUMN_NAME,
             REFERENCED_TABLE_NAME,
             REFERENCED_COLUMN_NAME
         FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
         WHERE TABLE_SCHEMA = %s 
-        AND TABLE_NAME = %s 
         AND REFERENCED_TABLE_NAME IS NOT NULL
+        AND TABLE_NAME IN ({placeholders})
         """
         
-        results = self.execute_query(query, (self.config.dbname, table_name))
+        results = self.execute_query_tuples(query, (self.config.dbname, *table_names))
         
-        foreign_keys = []
-        for row in results:
-            foreign_keys.append({
-                'constraint_name': row[0],
-                'column_name': row[1],
-                'referenced_table': row[2],
-                'referenced_column': row[3]
+        foreign_keys = {table: [] for table in table_names}
+        for row in results or []:
+            foreign_keys.setdefault(row[0], []).append({
+                'constraint_name': row[1],
+                'column_name': row[2],
+                'referenced_table': row[3],
+                'referenced_column': row[4]
             })
         
         return foreign_keys
     
-    def disable_foreign_key_checks(self) -> None:
-        """Desabilita verificação de chaves estrangeiras"""
-        self.execute_query("SET FOREIGN_KEY_CHECKS = 0", fetch_results=False)
-        self.logger.debug("Verificação de chaves estrangeiras desabilitada")
-    
-    def enable_foreign_key_checks(self) -> None:
-        """Habilita verificação de chaves estrangeiras"""
-        self.execute_query("SET FOREIGN_KEY_CHECKS = 1", fetch_results=False)
-        self.logger.debug("Verificação de chaves estrangeiras habilitada")
-    
     def get_table_data(self, table_name: str, limit: Optional[int] = None) -> List[Tuple]:
         """
         Obtém dados de uma tabela
@@ -456,7 +1234,293 @@ class DatabaseManager:
         if limit:
             query += f" LIMIT {limit}"
         
-        return self.execute_query(query) or []
+        return self.execute_query_tuples(query) or []
+    
+    def iter_table_data(self, table_name: str, chunk_size: int = 10000,
+                        columns: Optional[List[str]] = None,
+                        prefetch: int = 0,
+                        max_batch_bytes: Optional[int] = None) -> Iterator[List[Tuple]]:
+        """
+        Lê os dados de uma tabela em blocos, sem carregar o resultado inteiro em memória
+        
+        Usa um cursor não bufferizado em uma conexão dedicada (fora do pool), já que
+        o resultado em streaming ocupa a conexão até ser totalmente lido.
+        
+        Args:
+            table_name (str): Nome da tabela
+            chunk_size (int): Número de linhas por bloco
+            columns (List[str], optional): Colunas a selecionar, na ordem desejada
+            prefetch (int): Se maior que zero, lê até esse número de blocos à frente
+                em uma thread separada, sobrepondo leitura e gravação
+            max_batch_bytes (int, optional): Ajusta o número de linhas de cada bloco
+                pelo tamanho medido das linhas (chunk_size passa a ser o máximo)
+            
+        Returns:
+            Iterator[List[Tuple]]: Blocos de linhas da tabela
+        """
+        batches = self._read_table_batches(table_name, chunk_size, columns, max_batch_bytes)
+        if prefetch > 0:
+            return _prefetch_batches(batches, prefetch)
+        return batches
+    
+    def _read_table_batches(self, table_name: str, chunk_size: int,
+                            columns: Optional[List[str]],
+                            max_batch_bytes: Optional[int] = None) -> Iterator[List[Tuple]]:
+        """
+        Gerador de iter_table_data: executa o SELECT em streaming e produz os blocos
+        
+        Args:
+            table_name (str): Nome da tabela
+            chunk_size (int): Número de linhas por bloco (máximo, se max_batch_bytes)
+            columns (List[str], optional): Colunas a selecionar, na ordem desejada
+            max_batch_bytes (int, optional): Tamanho alvo de cada bloco em bytes
+            
+        Yields:
+            List[Tuple]: Bloco de linhas da tabela
+        """
+        columns_sql = ", ".join(f"`{col}`" for col in columns) if columns else "*"
+        query = f"SELECT {columns_sql} FROM `{table_name}`"
+        
+        try:
+            connection = mysql.connector.connect(**self.config.to_dict())
+        except MySQLError as e:
+            self.logger.error(f"Falha ao conectar com banco de dados: {e}")
+            raise DatabaseConnectionError(f"Falha na conexão: {e}")
+        
+        try:
+            cursor = connection.cursor(buffered=False)
+            cursor.execute(query)
+            
+            # Com alvo em bytes, começa com um bloco pequeno para medir as linhas
+            batch_rows = min(chunk_size, STREAM_FIRST_BATCH_ROWS) if max_batch_bytes else chunk_size
+            
+            while True:
+                rows = cursor.fetchmany(batch_rows)
+                if not rows:
+                    break
+                
+                if max_batch_bytes:
+                    sample = rows[:ROW_SIZE_SAMPLE]
+                    row_bytes = max(sum(_estimate_row_bytes(row) for row in sample) // len(sample), 1)
+                    batch_rows = max(1, min(chunk_size, max_batch_bytes // row_bytes))
+                
+                yield rows
+                
+        except MySQLError as e:
+            self.logger.error(f"Erro ao ler dados da tabela {table_name}: {e}")
+            raise DatabaseOperationError(f"Erro na leitura de {table_name}: {e}")
+        finally:
+            # Fecha direto o socket: funciona mesmo com linhas não lidas (leitura interrompida)
+            connection.close()
+    
+    def supports_local_infile(self) -> bool:
+        """
+        Verifica (uma única vez) se o servidor aceita LOAD DATA LOCAL INFILE
+        
+        Returns:
+            bool: True se local_infile estiver habilitado no servidor
+        """
+        if self._local_infile_supported is None:
+            try:
+                results = self.execute_query_tuples("SELECT @@GLOBAL.local_infile")
+                self._local_infile_supported = bool(results and int(results[0][0]))
+            except Exception as e:
+                self.logger.debug("Não foi possível verificar local_infile: %s", e)
+                self._local_infile_supported = False
+        
+        return self._local_infile_supported
+    
+    @contextmanager
+    def deferred_secondary_indexes(self, table_name: str):
+        """
+        Remove os índices secundários comuns durante uma carga em massa e os recria ao final
+        
+        O InnoDB deixa de manter cada índice a cada linha inserida e, ao final, todos
+        são reconstruídos em um único ALTER TABLE. Índices PRIMARY, UNIQUE, FULLTEXT
+        e SPATIAL, e os que começam por colunas de FK ou AUTO_INCREMENT, são mantidos.
+        
+        Args:
+            table_name (str): Nome da tabela (normalmente recém-criada e vazia)
+        """
+        definitions = []
+        
+        try:
+            create_statement = self.get_create_table_statement(table_name)
+            foreign_key_columns = {
+                fk['column_name'] for fk in self.get_foreign_keys_bulk([table_name]).get(table_name, [])
+            }
+            auto_increment_columns = {
+                col['Field'] for col in self.get_table_structure(table_name)
+                if col.get('Extra', '').lower() == 'auto_increment'
+            }
+            
+            definitions = [
+                (name, definition)
+                for definition, name, first_column in SECONDARY_INDEX_PATTERN.findall(create_statement)
+                if first_column not in foreign_key_columns and first_column not in auto_increment_columns
+            ]
+            
+            if definitions:
+                drops = ", ".join(f"DROP INDEX `{name}`" for name, _ in definitions)
+                self.execute_query(f"ALTER TABLE `{table_name}` {drops}", fetch_results=False)
+                self.invalidate(table_name)
+                self.logger.debug("%d índices de %s adiados para depois da carga", len(definitions), table_name)
+        except Exception as e:
+            self.logger.debug(f"Índices de {table_name} mantidos durante a carga: {e}")
+            definitions = []
+        
+        try:
+            yield
+        finally:
+            if definitions:
+                adds = ", ".join(f"ADD {definition}" for _, definition in definitions)
+                try:
+                    self.execute_query(f"ALTER TABLE `{table_name}` {adds}", fetch_results=False)
+                except DatabaseOperationError as e:
+                    self.logger.error(f"Erro ao recriar índices da tabela {table_name}: {e}")
+                    raise
+                finally:
+                    self.invalidate(table_name)
+    
+    def get_server_identity(self) -> Tuple:
+        """
+        Identifica a instância MySQL (para saber se dois bancos estão no mesmo servidor)
+        
+        Returns:
+            Tuple: (hostname, porta, datadir, server_id) do servidor
+        """
+        results = self.execute_query_tuples("SELECT @@hostname, @@port, @@datadir, @@server_id")
+        return tuple(results[0]) if results else ()
+    
+    def copy_table_from_schema(self, source_schema: str, table_name: str,
+                               columns: List[str], replace: bool = False) -> int:
+        """
+        Copia os dados de uma tabela de outro schema do mesmo servidor com INSERT ... SELECT
+        
+        As linhas não saem do servidor. A cópia roda em uma sessão de bulk_load (uma
+        transação, sem verificação de FKs e preservando IDs=0) e exige que o usuário
+        do destino tenha SELECT no schema de origem.
+        
+        Args:
+            source_schema (str): Schema de origem, no mesmo servidor
+            table_name (str): Nome da tabela (o mesmo nos dois schemas)
+            columns (List[str]): Colunas a copiar
+            replace (bool): Se True, substitui linhas com a mesma chave (REPLACE)
+            
+        Returns:
+            int: Número de linhas copiadas
+        """
+        columns_sql = ", ".join(f"`{col}`" for col in columns)
+        verb = "REPLACE" if replace else "INSERT"
+        query = (
+            f"{verb} INTO `{table_name}` ({columns_sql}) "
+            f"SELECT {columns_sql} FROM `{source_schema}`.`{table_name}`"
+        )
+        
+        with self.bulk_load() as conn:
+            cursor = conn.cursor()
+            # O erro é convertido aqui dentro: get_connection transformaria um MySQLError
+            # do bloco em DatabaseConnectionError (ex.: sem SELECT no schema de origem)
+            try:
+                cursor.execute(query)
+            except MySQLError as e:
+                self.logger.error(f"Erro na cópia de {source_schema}.{table_name}: {e}")
+                raise DatabaseOperationError(f"Erro na cópia de {source_schema}.{table_name}: {e}")
+            copied = cursor.rowcount
+        
+        self.logger.debug("INSERT ... SELECT em %s: %d linhas copiadas de %s", table_name, copied, source_schema)
+        return copied
+    
+    def load_data_local(self, table_name: str, columns: List[str],
+                        row_batches: Iterator[List[Tuple]], replace: bool = False) -> int:
+        """
+        Carrega linhas em uma tabela via LOAD DATA LOCAL INFILE
+        
+        As linhas são enviadas no formato padrão do LOAD DATA e carregadas em um
+        único comando, em uma conexão dedicada que só pode ler arquivos do diretório
+        temporário criado aqui. Onde há pipes nomeados (POSIX), uma thread escreve as
+        linhas no pipe enquanto o servidor as carrega, sem arquivo intermediário em
+        disco; nos demais sistemas as linhas são gravadas antes em um arquivo temporário.
+        
+        Args:
+            table_name (str): Tabela de destino
+            columns (List[str]): Colunas, na ordem dos valores de cada linha
+            row_batches (Iterator[List[Tuple]]): Blocos de linhas a carregar
+            replace (bool): Se True, substitui linhas com a mesma chave (REPLACE)
+            
+        Returns:
+            int: Número de linhas carregadas
+        """
+        encoding = 'utf-8' if self.config.charset.lower().startswith('utf8') else self.config.charset
+        temp_dir = tempfile.mkdtemp(prefix='replicoop_load_')
+        data_path = os.path.join(temp_dir, f"{table_name}.tsv")
+        writer = None
+        writer_errors = []
+        
+        try:
+            if hasattr(os, 'mkfifo'):
+                os.mkfifo(data_path)
+                
+                def write() -> None:
+                    try:
+                        with open(data_path, 'wb') as data_file:
+                            _write_load_data_rows(data_file, row_batches, encoding)
+                    except BaseException as e:
+                        writer_errors.append(e)
+                    finally:
+                        close = getattr(row_batches, 'close', None)
+                        if close:
+                            close()
+                
+                writer = threading.Thread(target=write, name=f"load-data-{table_name}", daemon=True)
+                writer.start()
+            else:
+                with open(data_path, 'wb') as data_file:
+                    _write_load_data_rows(data_file, row_batches, encoding)
+            
+            columns_sql = ", ".join(f"`{col}`" for col in columns)
+            mode = "REPLACE" if replace else ""
+            # Caminho com barras normais: aceito pelo MySQL também no Windows
+            query = (
+                f"LOAD DATA LOCAL INFILE '{data_path.replace(os.sep, '/')}' {mode} "
+                f"INTO TABLE `{table_name}` CHARACTER SET {self.config.charset} ({columns_sql})"
+            )
+            
+            connection = mysql.connector.connect(
+                allow_local_infile_in_path=temp_dir, **self.config.to_dict()
+            )
+            try:
+                cursor = connection.cursor()
+                cursor.execute(
+                    "SET SESSION FOREIGN_KEY_CHECKS = 0, UNIQUE_CHECKS = 0, "
+                    "sql_mode = 'NO_AUTO_VALUE_ON_ZERO,NO_ENGINE_SUBSTITUTION'"
+                )
+                cursor.execute(query)
+                
+                # Fim do pipe também ocorre se a leitura da origem falhar: não confirma dados parciais
+                if writer is not None:
+                    writer.join()
+                    if writer_errors:
+                        connection.rollback()
+                        raise DatabaseOperationError(
+                            f"Erro na leitura dos dados de {table_name}: {writer_errors[0]}"
+                        )
+                
+                connection.commit()
+                loaded = cursor.rowcount
+            finally:
+                self._close_connection(connection)
+            
+            self.logger.debug("LOAD DATA em %s: %d linhas carregadas", table_name, loaded)
+            return loaded
+            
+        except MySQLError as e:
+            self.logger.error(f"Erro no LOAD DATA da tabela {table_name}: {e}")
+            raise DatabaseOperationError(f"Erro no LOAD DATA de {table_name}: {e}")
+        finally:
+            if writer is not None:
+                _release_fifo_writer(data_path, writer)
+            shutil.rmtree(temp_dir, ignore_errors=True)
     
     def drop_table_if_exists(self, table_name: str) -> None:
         """
@@ -466,32 +1530,160 @@ class DatabaseManager:
             table_name (str): Nome da tabela
         """
         try:
-            # Executa comandos na mesma conexão
-            commands = [
-                "SET FOREIGN_KEY_CHECKS = 0",
-                f"DROP TABLE IF EXISTS `{table_name}`",
+            # Executa os comandos na mesma conexão, em uma única ida ao servidor
+            commands = (
+                "SET FOREIGN_KEY_CHECKS = 0; "
+                f"DROP TABLE IF EXISTS `{table_name}`; "
                 "SET FOREIGN_KEY_CHECKS = 1"
-            ]
+            )
             
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                for command in commands:
+                try:
+                    # Consome todos os resultados para que erros de qualquer comando apareçam
+                    for result in cursor.execute(commands, multi=True):
+                        self.logger.debug("Executado: %s", result.statement)
+                except MySQLError:
+                    # Se o DROP falhou, garante FKs reativadas antes de relançar o erro
                     try:
-                        cursor.execute(command)
-                        self.logger.debug(f"Executado: {command}")
-                    except Exception as cmd_error:
-                        self.logger.debug(f"Erro no comando '{command}': {cmd_error}")
-                        if "DROP TABLE" in command:
-                            # Se o DROP falhou, relança o erro
-                            raise
+                        cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+                    except MySQLError:
+                        pass
+                    raise
                 conn.commit()
             
-            self.logger.debug(f"Tabela {table_name} removida (se existia)")
+            self.invalidate(table_name)
+            self.logger.debug("Tabela %s removida (se existia)", table_name)
             
         except Exception as e:
             self.logger.error(f"Erro ao remover tabela {table_name}: {e}")
             raise
     
+    def truncate_table(self, table_name: str) -> None:
+        """
+        Esvazia uma tabela com TRUNCATE TABLE (sem gravar cada linha em undo/binlog)
+        
+        As FKs são desabilitadas na mesma conexão, já que o TRUNCATE recusa tabelas
+        referenciadas; se ainda assim falhar, usa DELETE FROM na mesma conexão.
+        
+        Args:
+            table_name (str): Nome da tabela
+        """
+        commands = (
+            "SET FOREIGN_KEY_CHECKS = 0; "
+            f"TRUNCATE TABLE `{table_name}`; "
+            "SET FOREIGN_KEY_CHECKS = 1"
+        )
+        
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                # A falha é tratada aqui dentro: get_connection transformaria um
+                # MySQLError do bloco em DatabaseConnectionError
+                try:
+                    for result in cursor.execute(commands, multi=True):
+                        pass
+                    self.logger.debug("Tabela %s esvaziada com TRUNCATE", table_name)
+                except MySQLError as e:
+                    self.logger.debug(f"TRUNCATE indisponível para {table_name}, usando DELETE: {e}")
+                    try:
+                        cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+                        cursor.execute(f"DELETE FROM `{table_name}`")
+                        conn.commit()
+                    except MySQLError as delete_error:
+                        self.logger.error(f"Erro ao esvaziar tabela {table_name}: {delete_error}")
+                        raise DatabaseOperationError(f"Erro ao esvaziar {table_name}: {delete_error}")
+                    finally:
+                        try:
+                            cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+                        except MySQLError:
+                            pass
+        finally:
+            self.invalidate(table_name)
+    
+    def recreate_tables(self, create_statements: Dict[str, str]) -> None:
+        """
+        Remove e recria várias tabelas em uma única ida ao servidor
+        
+        Os DROPs rodam com as FKs desabilitadas na mesma conexão; os CREATEs já com
+        as FKs reativadas, como em drop_table_if_exists seguido de create_table_from_statement.
+        
+        Args:
+            create_statements (Dict[str, str]): CREATE TABLE de cada tabela, na ordem de criação
+        """
+        if not create_statements:
+            return
+        
+        try:
+            drops = "".join(f"DROP TABLE IF EXISTS `{table}`; " for table in create_statements)
+            creates = "; ".join(statement.rstrip().rstrip(';') for statement in create_statements.values())
+            commands = f"SET FOREIGN_KEY_CHECKS = 0; {drops}SET FOREIGN_KEY_CHECKS = 1; {creates}"
+            
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                # O erro é convertido aqui dentro: get_connection transformaria um
+                # MySQLError do bloco em DatabaseConnectionError
+                try:
+                    # Consome todos os resultados para que erros de qualquer comando apareçam
+                    for result in cursor.execute(commands, multi=True):
+                        pass
+                    conn.commit()
+                except MySQLError as e:
+                    # Garante FKs reativadas caso a falha tenha ocorrido entre os DROPs
+                    try:
+                        cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+                    except MySQLError:
+                        pass
+                    self.logger.debug(f"Erro ao recriar tabelas em lote: {e}")
+                    raise DatabaseOperationError(f"Erro ao recriar tabelas: {e}")
+            
+            self.logger.debug("%d tabelas recriadas em lote", len(create_statements))
+            
+        finally:
+            self.invalidate()
+    
+    def add_foreign_keys(self, table_name: str, clauses: List[str]) -> None:
+        """
+        Adiciona várias chaves estrangeiras a uma tabela com um único ALTER TABLE
+        
+        As FKs são criadas com FOREIGN_KEY_CHECKS = 0 na mesma conexão: o InnoDB não
+        revalida os dados existentes e a alteração é feita sem copiar a tabela.
+        
+        Args:
+            table_name (str): Nome da tabela
+            clauses (List[str]): Cláusulas "CONSTRAINT ... FOREIGN KEY ... REFERENCES ..."
+        """
+        if not clauses:
+            return
+        
+        additions = ", ".join(f"ADD {clause}" for clause in clauses)
+        commands = (
+            "SET FOREIGN_KEY_CHECKS = 0; "
+            f"ALTER TABLE `{table_name}` {additions}; "
+            "SET FOREIGN_KEY_CHECKS = 1"
+        )
+        
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                # O erro é convertido aqui dentro: get_connection transformaria um
+                # MySQLError do bloco em DatabaseConnectionError
+                try:
+                    for result in cursor.execute(commands, multi=True):
+                        pass
+                except MySQLError as e:
+                    try:
+                        cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+                    except MySQLError:
+                        pass
+                    self.logger.error(f"Erro ao adicionar chaves estrangeiras em {table_name}: {e}")
+                    raise DatabaseOperationError(f"Erro ao adicionar FKs em {table_name}: {e}")
+            
+            self.logger.debug("%d chaves estrangeiras adicionadas em %s", len(clauses), table_name)
+            
+        finally:
+            self.invalidate(table_name)
+    
     def disable_foreign_key_checks(self) -> None:
         """
         Desabilita as verificações de foreign key para a sessão atual
@@ -520,4 +1712,23 @@ class DatabaseManager:
             create_statement (str): Statement CREATE TABLE
         """
         self.execute_query(create_statement, fetch_results=False)
-        self.logger.debug("Tabela criada a partir do statement fornecido")
\ No newline at end of file
+        
+        # Descarta só a tabela criada; sem nome reconhecível, limpa o cache inteiro
+        match = CREATE_TABLE_NAME_PATTERN.match(create_statement)
+        self.invalidate(match.group(1).replace("``", "`") if match else None)
+        self.logger.debug("Tabela criada a partir do statement fornecido")
+    
+    def rename_table(self, table_name: str, new_name: str) -> None:
+        """
+        Renomeia uma tabela, descartando os metadados em cache dos dois nomes
+        
+        Args:
+            table_name (str): Nome atual da tabela
+            new_name (str): Novo nome da tabela
+        """
+        try:
+            self.execute_query(f"RENAME TABLE `{table_name}` TO `{new_name}`", fetch_results=False)
+        finally:
+            self.invalidate(table_name)
+            self.invalidate(new_name)
+        self.logger.debug("Tabela %s renomeada para %s", table_name, new_name)
\ No newline at end of file
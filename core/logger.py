@@ -1,15 +1,23 @@
 """
 Módulo de logging do sistema ReplicOOP
 """
+import atexit
 import logging
 import os
-from datetime import datetime
-from typing import Optional
+import queue
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from typing import Dict, Optional
 from colorama import Fore, Style, init
 
 # Inicializa colorama para Windows
 init(autoreset=True)
 
+# Arquivo de log atual; à meia-noite é rotacionado para replicoop.log.AAAA-MM-DD
+LOG_FILENAME = "replicoop.log"
+
+# Quantidade de arquivos diários mantidos
+LOG_FILE_BACKUP_COUNT = 14
+
 
 class ColoredFormatter(logging.Formatter):
     """Formatador colorido para logs no console"""
@@ -22,15 +30,29 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': Fore.MAGENTA
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Nomes de nível já coloridos, montados uma única vez
+        self._colored = {
+            level: f"{color}{level}{Style.RESET_ALL}" for level, color in self.COLORS.items()
+        }
+    
     def format(self, record):
-        log_color = self.COLORS.get(record.levelname, '')
-        record.levelname = f"{log_color}{record.levelname}{Style.RESET_ALL}"
-        return super().format(record)
+        # Colore apenas durante a formatação: o registro é compartilhado com o handler de arquivo
+        levelname = record.levelname
+        record.levelname = self._colored.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 class LoggerManager:
     """Gerenciador de logs do sistema"""
     
+    # Listener ativo por nome de logger (recriar o logger encerra o anterior)
+    _listeners: Dict[str, QueueListener] = {}
+    
     def __init__(self, name: str = "ReplicOOP", logs_path: Optional[str] = None):
         """
         Inicializa o gerenciador de logs
@@ -41,15 +63,27 @@ class LoggerManager:
         """
         self.name = name
         self.logs_path = logs_path or os.path.join(os.getcwd(), 'logs')
+        self._listener: Optional[QueueListener] = None
         self.logger = self._setup_logger()
+        atexit.register(self.close)
     
     def _setup_logger(self) -> logging.Logger:
-        """Configura e retorna o logger"""
+        """
+        Configura e retorna o logger
+        
+        O logger recebe apenas um QueueHandler; a escrita em console e arquivo
+        é feita por um QueueListener em thread própria, fora do caminho de quem loga.
+        """
         logger = logging.getLogger(self.name)
         logger.setLevel(logging.DEBUG)
         
         # Remove handlers existentes para evitar duplicação
         logger.handlers.clear()
+        previous_listener = LoggerManager._listeners.pop(self.name, None)
+        if previous_listener is not None:
+            self._stop_listener(previous_listener)
+        
+        handlers = []
         
         # Handler para console com cores
         console_handler = logging.StreamHandler()
@@ -59,45 +93,80 @@ class LoggerManager:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
         
         # Handler para arquivo
         if self.logs_path:
             os.makedirs(self.logs_path, exist_ok=True)
-            log_filename = f"replicoop_{datetime.now().strftime('%Y%m%d')}.log"
-            log_filepath = os.path.join(self.logs_path, log_filename)
+            log_filepath = os.path.join(self.logs_path, LOG_FILENAME)
             
-            file_handler = logging.FileHandler(log_filepath, encoding='utf-8')
+            # delay=True: o arquivo só é aberto na primeira escrita
+            file_handler = TimedRotatingFileHandler(
+                log_filepath, when='midnight', backupCount=LOG_FILE_BACKUP_COUNT,
+                encoding='utf-8', delay=True
+            )
             file_handler.setLevel(logging.DEBUG)
             file_formatter = logging.Formatter(
                 '[%(asctime)s] %(levelname)s - %(name)s - %(message)s',
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
+        
+        log_queue = queue.Queue(-1)
+        logger.addHandler(QueueHandler(log_queue))
+        
+        self._listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._listener.start()
+        LoggerManager._listeners[self.name] = self._listener
         
         return logger
     
-    def debug(self, message: str) -> None:
-        """Log de debug"""
-        self.logger.debug(message)
+    @staticmethod
+    def _stop_listener(listener: QueueListener) -> None:
+        """Descarrega a fila e fecha os handlers de um listener"""
+        try:
+            listener.stop()
+        except AttributeError:
+            # Listener já encerrado
+            pass
+        for handler in listener.handlers:
+            handler.close()
+    
+    def close(self) -> None:
+        """Encerra a escrita assíncrona, gravando as mensagens pendentes"""
+        listener, self._listener = self._listener, None
+        if listener is None:
+            return
+        if LoggerManager._listeners.get(self.name) is listener:
+            del LoggerManager._listeners[self.name]
+            self._stop_listener(listener)
+    
+    def debug(self, message: str, *args, **kwargs) -> None:
+        """
+        Log de debug
+        
+        Os args são formatados com % e o traceback (exc_info=True) só é montado
+        se a mensagem for de fato emitida.
+        """
+        self.logger.debug(message, *args, **kwargs)
     
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args, **kwargs) -> None:
         """Log de informação"""
-        self.logger.info(message)
+        self.logger.info(message, *args, **kwargs)
     
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args, **kwargs) -> None:
         """Log de aviso"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args, **kwargs)
     
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args, **kwargs) -> None:
         """Log de erro"""
-        self.logger.error(message)
+        self.logger.error(message, *args, **kwargs)
     
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args, **kwargs) -> None:
         """Log crítico"""
-        self.logger.critical(message)
+        self.logger.critical(message, *args, **kwargs)
     
-    def exception(self, message: str) -> None:
+    def exception(self, message: str, *args, **kwargs) -> None:
         """Log de exceção com traceback"""
-        self.logger.exception(message)
\ No newline at end of file
+        self.logger.exception(message, *args, **kwargs)
\ No newline at end of file
@@ -1,17 +1,43 @@
 """
 Módulo principal de replicação do sistema ReplicOOP
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from datetime import datetime
+import asyncio
+import functools
+import hashlib
+import random
+import re
+import shutil
 import time
 from tqdm import tqdm
 
 from .config import ConfigManager, DatabaseConfig
 from .logger import LoggerManager
-from .database import DatabaseManager, DatabaseOperationError
+from .database import DatabaseManager, DatabaseOperationError, STREAM_PREFETCH_BATCHES, STREAM_BATCH_MAX_BYTES
 from .backup import BackupManager, BackupError
 
 
+# Tamanho mínimo (bytes) para copiar os dados de uma tabela via mysqldump | mysql
+DUMP_PIPE_MIN_BYTES = 100 << 20
+
+# Linhas estimadas a partir das quais os índices secundários são recriados após a carga
+DEFER_INDEXES_MIN_ROWS = 100_000
+
+# Cláusula de chave estrangeira do CREATE TABLE, incluindo a vírgula que a precede
+FOREIGN_KEY_CLAUSE_PATTERN = re.compile(
+    r",\s*(?:CONSTRAINT\s+`[^`]*`\s+)?FOREIGN\s+KEY\s*(?:`[^`]*`\s*)?\([^)]*\)"
+    r"\s*REFERENCES\s+`[^`]*`(?:\.`[^`]*`)?\s*\([^)]*\)"
+    r"(?:\s+ON\s+(?:DELETE|UPDATE)\s+(?:CASCADE|RESTRICT|SET\s+NULL|SET\s+DEFAULT|NO\s+ACTION))*",
+    re.IGNORECASE
+)
+
+# Nome da tabela no início do CREATE TABLE
+CREATE_TABLE_NAME_PATTERN = re.compile(r"CREATE TABLE `[^`]+`")
+
+
 class ReplicationError(Exception):
     """Exceção personalizada para erros de replicação"""
     pass
@@ -36,6 +62,9 @@ class ReplicationManager:
         self.source_db = None
         self.target_db = None
         self.backup_manager = None
+        self._source_backup_manager = None
+        self._dump_pipe_available = None
+        self._same_server = None
         
         self.logger.info("Sistema ReplicOOP inicializado")
     
@@ -51,15 +80,21 @@ class ReplicationManager:
         try:
             # Configuração do banco de origem
             source_config = self.config_manager.get_database_config(source_env)
-            self.source_db = DatabaseManager(source_config, self.logger)
+            pool_size = self.config_manager.get_pool_size()
+            self.source_db = DatabaseManager(source_config, self.logger, pool_size=pool_size)
             
             # Configuração do banco de destino
             target_config = self.config_manager.get_database_config(target_env)
-            self.target_db = DatabaseManager(target_config, self.logger)
+            self.target_db = DatabaseManager(target_config, self.logger, pool_size=pool_size)
             
             # Configuração do gerenciador de backup
             backup_path = self.config_manager.get_backup_path()
-            self.backup_manager = BackupManager(self.target_db, self.logger, backup_path)
+            self.backup_manager = BackupManager(
+                self.target_db, self.logger, backup_path,
+                write_buffer_size=self.config_manager.get_write_buffer_size()
+            )
+            self._source_backup_manager = None
+            self._same_server = None
             
             self.logger.info(f"Bancos configurados: {source_env} -> {target_env}")
             
@@ -118,13 +153,14 @@ class ReplicationManager:
                 tables = self.config_manager.get_maintain_tables()
                 self.logger.info(f"Tabelas maintain configuradas: {tables}")
                 if not tables:
-                    tables = self.source_db.get_tables()
+                    tables = self.source_db.get_tables(cached=True)
                     self.logger.info(f"Usando todas as tabelas do banco de origem: {len(tables)} tabelas")
             else:
                 self.logger.info(f"Usando tabelas especificadas: {len(tables) if isinstance(tables, list) else 'N/A'} tabelas")
             
-            source_tables = self.source_db.get_tables()
-            target_tables = self.target_db.get_tables()
+            # Conjuntos para verificações de pertinência em O(1)
+            source_tables = set(self.source_db.get_tables(cached=True))
+            target_tables = set(self.target_db.get_tables(cached=True))
             
             self.logger.info(f"Tabelas no banco de origem: {len(source_tables)}")
             self.logger.info(f"Tabelas no banco de destino: {len(target_tables)}")
@@ -144,6 +180,15 @@ class ReplicationManager:
                 'warnings': []
             }
             
+            # Obtém as FKs de todas as tabelas com uma única consulta
+            try:
+                foreign_keys_by_table = self.source_db.get_foreign_keys_bulk(
+                    [table for table in tables if table in source_tables]
+                )
+            except Exception as e:
+                self.logger.warning(f"Erro ao analisar FKs das tabelas: {e}")
+                foreign_keys_by_table = {}
+            
             # Analisa cada tabela para replicação
             for table in tables:
                 if table not in source_tables:
@@ -162,28 +207,26 @@ class ReplicationManager:
                     table_plan['action'] = 'recreate'
                 
                 # Analisa chaves estrangeiras
-                try:
-                    foreign_keys = self.source_db.get_foreign_keys(table)
-                    if foreign_keys:
-                        table_plan['has_foreign_keys'] = True
-                        table_plan['foreign_keys'] = foreign_keys
-                        
-                        # Verifica se tabelas referenciadas existem
-                        for fk in foreign_keys:
-                            ref_table = fk['referenced_table']
-                            if ref_table not in source_tables:
-                                plan['foreign_key_issues'].append(
-                                    f"Tabela referenciada '{ref_table}' não encontrada para FK em '{table}'"
-                                )
-                
-                except Exception as e:
-                    self.logger.warning(f"Erro ao analisar FKs da tabela {table}: {e}")
+                foreign_keys = foreign_keys_by_table.get(table, [])
+                if foreign_keys:
+                    table_plan['has_foreign_keys'] = True
+                    table_plan['foreign_keys'] = foreign_keys
+                    
+                    # Verifica se tabelas referenciadas existem
+                    for fk in foreign_keys:
+                        ref_table = fk['referenced_table']
+                        if ref_table not in source_tables:
+                            plan['foreign_key_issues'].append(
+                                f"Tabela referenciada '{ref_table}' não encontrada para FK em '{table}'"
+                            )
                 
                 plan['tables_to_replicate'].append(table_plan)
             
             # Identifica tabelas no destino que não estão na lista de replicação
-            for table in target_tables:
-                if table not in tables and table not in [t['name'] for t in plan['tables_to_replicate']]:
+            requested_tables = set(tables)
+            replicate_names = {t['name'] for t in plan['tables_to_replicate']}
+            for table in sorted(target_tables):
+                if table not in requested_tables and table not in replicate_names:
                     plan['tables_to_drop'].append(table)
             
             self.logger.info(f"Plano de replicação criado: {len(plan['tables_to_replicate'])} tabelas")
@@ -193,13 +236,13 @@ class ReplicationManager:
         except Exception as e:
             self.logger.error(f"Erro ao criar plano de replicação: {e}")
             self.logger.error(f"Tipo do erro: {type(e).__name__}")
-            import traceback
-            self.logger.error(f"Traceback completo: {traceback.format_exc()}")
+            self.logger.debug("Traceback do planejamento", exc_info=True)
             raise ReplicationError(f"Falha no planejamento: {e}")
     
     def execute_replication(self, tables: Optional[List[str]] = None, 
                           create_backup: bool = True,
-                          replicate_data: bool = False) -> Dict[str, Any]:
+                          replicate_data: bool = False,
+                          max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Executa a replicação de estrutura das tabelas
         
@@ -207,6 +250,8 @@ class ReplicationManager:
             tables (List[str], optional): Lista de tabelas específicas
             create_backup (bool): Se deve criar backup antes da replicação
             replicate_data (bool): Se deve replicar dados das tabelas maintain
+            max_workers (int, optional): Tabelas replicadas em paralelo
+                (padrão: tamanho do pool de conexões)
             
         Returns:
             Dict[str, Any]: Relatório da replicação
@@ -217,6 +262,10 @@ class ReplicationManager:
         try:
             self.logger.info("=== INICIANDO REPLICAÇÃO DE ESTRUTURA ===")
             
+            # Metadados em cache valem apenas dentro de uma execução
+            self.source_db.invalidate()
+            self.target_db.invalidate()
+            
             # Cria backup se solicitado
             if create_backup:
                 backup_path = self.create_backup_before_replication()
@@ -224,10 +273,8 @@ class ReplicationManager:
             # Cria plano de replicação
             # Se tables não foi especificado, replica TODAS as tabelas do banco de origem
             if tables is None:
-                tables = self.source_db.get_tables()
+                tables = self.source_db.get_tables(cached=True)
                 self.logger.info(f"Replicando TODAS as tabelas do banco de origem: {len(tables)} tabelas")
-                # Ordena tabelas por dependências de Foreign Keys
-                tables = self._sort_tables_by_dependencies(tables)
             
             plan = self.get_replication_plan(tables)
             
@@ -242,138 +289,97 @@ class ReplicationManager:
                 }
             
             # Obtém lista de tabelas maintain para replicação de dados
-            maintain_tables = self.config_manager.get_maintain_tables()
+            maintain_tables = set(self.config_manager.get_maintain_tables())
             
-            # Desabilita verificação de FKs no destino
-            self.target_db.disable_foreign_key_checks()
+            # Obtém os CREATE TABLE de origem de todas as tabelas em paralelo
+            table_names = [table_plan['name'] for table_plan in plan['tables_to_replicate']]
+            source_descriptions = self.source_db.describe_tables_parallel(table_names)
             
-            replicated_tables = []
-            failed_tables = []
-            data_replicated_tables = []
+            # Verifica de uma só vez quais tabelas já existem no destino
+            existing_target_tables = self.target_db.tables_exist(table_names)
+            
+            # Tabelas idênticas na origem e no destino não precisam ser recriadas
+            unchanged_tables = self._find_unchanged_tables(
+                [table_name for table_name in table_names if table_name in existing_target_tables],
+                source_descriptions,
+                maintain_tables
+            )
+            
+            # Tabelas criadas do zero nascem sem FKs (a ordem de criação deixa de importar);
+            # as FKs são adicionadas em uma segunda fase, depois de todas existirem
+            descriptions, deferred_foreign_keys = self._defer_foreign_keys(
+                table_names, source_descriptions, maintain_tables,
+                existing_target_tables, unchanged_tables
+            )
+            
+            plans_by_name = {table_plan['name']: table_plan for table_plan in plan['tables_to_replicate']}
+            workers = max_workers or self.source_db.pool_size
+            results = {}
             
             # Barra de progresso
-            with tqdm(total=len(plan['tables_to_replicate']), desc="Replicando tabelas") as pbar:
+            with tqdm(total=len(table_names), desc="Replicando tabelas") as pbar:
+                recreated_tables = self._recreate_tables_batch(
+                    table_names, descriptions, maintain_tables,
+                    existing_target_tables, unchanged_tables
+                )
                 
-                for table_plan in plan['tables_to_replicate']:
-                    table_name = table_plan['name']
-                    is_maintain_table = table_name in maintain_tables
-                    
-                    try:
-                        pbar.set_description(f"Replicando {table_name}")
-                        
-                        # Obtém estrutura da tabela de origem
-                        create_statement = self.source_db.get_create_table_statement(table_name)
-                        
-                        if is_maintain_table:
-                            # TABELAS MAINTAIN: Remove completamente e recria com dados de origem
-                            self.logger.debug(f"Tabela MAINTAIN {table_name}: replicando estrutura + dados")
-                            
-                            # Remove tabela no destino se existir
-                            self.target_db.drop_table_if_exists(table_name)
-                            
-                            # Cria tabela no destino
-                            self.target_db.create_table_from_statement(create_statement)
-                            
-                            # RESETAR AUTO_INCREMENT para preservar IDs originais
-                            try:
-                                # Verifica se a tabela tem campo AUTO_INCREMENT
-                                table_structure = self.target_db.get_table_structure(table_name)
-                                has_auto_increment = any(col.get('Extra', '').lower() == 'auto_increment' for col in table_structure)
-                                
-                                if has_auto_increment:
-                                    self.logger.debug(f"Resetando AUTO_INCREMENT da tabela {table_name} para preservar IDs originais")
-                                    self.target_db.execute_query(f"ALTER TABLE `{table_name}` AUTO_INCREMENT = 1", fetch_results=False)
-                            except Exception as e:
-                                self.logger.warning(f"Não foi possível resetar AUTO_INCREMENT para {table_name}: {e}")
-                            
-                            # Replica os dados de origem
-                            try:
-                                self._replicate_table_data(table_name)
-                                data_replicated_tables.append(table_name)
-                                replicated_tables.append(f"{table_name} (estrutura + dados)")
-                                self.logger.debug(f"Tabela maintain {table_name} replicada com estrutura e dados")
-                            except Exception as data_error:
-                                # Se falhar na replicação de dados, ainda marca como sucesso estrutural
-                                replicated_tables.append(f"{table_name} (apenas estrutura)")
-                                self.logger.warning(f"Estrutura de {table_name} criada, mas falhou na replicação dos dados: {data_error}")
-                        
-                        else:
-                            # TABELAS NÃO-MAINTAIN: Preserva dados existentes e atualiza apenas estrutura
-                            self.logger.debug(f"Tabela NÃO-MAINTAIN {table_name}: preservando dados, atualizando estrutura")
-                            
-                            # Verifica se a tabela já existe no destino
-                            table_exists = self.target_db.table_exists(table_name)
-                            
-                            if table_exists:
-                                # Preserva os dados existentes durante atualização estrutural
-                                self._update_table_structure_preserving_data(table_name, create_statement)
-                                replicated_tables.append(f"{table_name} (estrutura atualizada, dados preservados)")
-                                self.logger.debug(f"Tabela não-maintain {table_name}: estrutura atualizada, dados preservados")
-                            else:
-                                # Tabela não existe: cria nova apenas com estrutura (sem dados)
-                                self.target_db.create_table_from_statement(create_statement)
-                                replicated_tables.append(f"{table_name} (nova estrutura criada)")
-                                self.logger.debug(f"Tabela não-maintain {table_name}: nova tabela criada (apenas estrutura)")
-                        
-                    except DatabaseOperationError as e:
-                        # Se for erro relacionado a FK, tenta ignorar
-                        if "foreign key" in str(e).lower() or "constraint" in str(e).lower():
-                            self.logger.warning(f"Erro de FK ignorado para {table_name}: {e}")
-                            
-                            # Tenta criar tabela sem FKs
-                            try:
-                                modified_statement = self._remove_foreign_keys_from_create_statement(
-                                    create_statement
-                                )
-                                
-                                self.target_db.drop_table_if_exists(table_name)
-                                self.target_db.create_table_from_statement(modified_statement)
-                                
-                                # Verifica se deve replicar dados mesmo sem FKs
-                                if is_maintain_table and replicate_data:
-                                    try:
-                                        self._replicate_table_data(table_name)
-                                        data_replicated_tables.append(table_name)
-                                        replicated_tables.append(f"{table_name} (sem FKs, estrutura + dados)")
-                                    except Exception as data_error:
-                                        replicated_tables.append(f"{table_name} (sem FKs)")
-                                        self.logger.warning(f"Dados de {table_name} não replicados: {data_error}")
-                                else:
-                                    replicated_tables.append(f"{table_name} (sem FKs)")
-                                
-                                self.logger.info(f"Tabela {table_name} criada sem chaves estrangeiras")
-                                
-                            except Exception as e2:
-                                failed_tables.append({
-                                    'table': table_name,
-                                    'error': str(e2)
-                                })
-                                self.logger.error(f"Falha ao criar {table_name} mesmo sem FKs: {e2}")
-                        else:
-                            failed_tables.append({
-                                'table': table_name,
-                                'error': str(e)
-                            })
-                            self.logger.error(f"Erro ao replicar {table_name}: {e}")
-                            self.logger.error(f"Tipo do erro: {type(e).__name__}")
-                            import traceback
-                            self.logger.error(f"Traceback: {traceback.format_exc()}")
-                    
-                    except Exception as e:
-                        failed_tables.append({
-                            'table': table_name,
-                            'error': str(e)
-                        })
-                        self.logger.error(f"Erro inesperado ao replicar {table_name}: {e}")
-                        self.logger.error(f"Tipo do erro: {type(e).__name__}")
-                        import traceback
-                        self.logger.error(f"Traceback: {traceback.format_exc()}")
+                for table_name in table_names:
+                    if table_name in unchanged_tables:
+                        results[table_name] = {
+                            'replicated': f"{table_name} (inalterada, ignorada)",
+                            'data_replicated': False,
+                            'failed': None
+                        }
+                        pbar.update(1)
+                
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        executor.submit(
+                            self._replicate_one_table,
+                            plans_by_name[table_name],
+                            descriptions.get(table_name),
+                            table_name in maintain_tables,
+                            table_name in existing_target_tables,
+                            replicate_data,
+                            table_name in recreated_tables
+                        ): table_name
+                        for table_name in table_names
+                        if table_name not in unchanged_tables
+                    }
                     
-                    finally:
+                    for future in as_completed(futures):
+                        table_name = futures[future]
+                        results[table_name] = future.result()
+                        pbar.set_description(f"Replicado {table_name}")
                         pbar.update(1)
             
-            # Reabilita verificação de FKs
-            self.target_db.enable_foreign_key_checks()
+            # Segunda fase: um ALTER TABLE por tabela com todas as suas FKs
+            foreign_key_failures = []
+            for table_name, clauses in deferred_foreign_keys.items():
+                if results[table_name]['failed']:
+                    continue
+                try:
+                    self.target_db.add_foreign_keys(table_name, clauses)
+                except Exception as e:
+                    self.logger.warning(f"Tabela {table_name} mantida sem chaves estrangeiras: {e}")
+                    foreign_key_failures.append({
+                        'table': table_name,
+                        'error': str(e)
+                    })
+            
+            # Consolida os resultados na ordem do plano
+            replicated_tables = []
+            failed_tables = []
+            data_replicated_tables = []
+            
+            for table_name in table_names:
+                result = results[table_name]
+                if result['replicated']:
+                    replicated_tables.append(result['replicated'])
+                if result['data_replicated']:
+                    data_replicated_tables.append(table_name)
+                if result['failed']:
+                    failed_tables.append(result['failed'])
             
             execution_time = time.time() - start_time
             success_count = len(replicated_tables)
@@ -385,6 +391,8 @@ class ReplicationManager:
                 self.logger.info("Replicação concluída com sucesso!")
             
             self.logger.info(f"Tabelas replicadas: {success_count}")
+            if unchanged_tables:
+                self.logger.info(f"Tabelas inalteradas ignoradas: {len(unchanged_tables)}")
             if data_replicated_tables:
                 self.logger.info(f"Tabelas com dados replicados: {len(data_replicated_tables)}")
             self.logger.info(f"Tempo de execução: {execution_time:.2f}s")
@@ -394,6 +402,8 @@ class ReplicationManager:
                 'tables_replicated': success_count,
                 'replicated_tables': replicated_tables,
                 'data_replicated_tables': data_replicated_tables,
+                'skipped_tables': sorted(unchanged_tables),
+                'foreign_key_failures': foreign_key_failures,
                 'failed_tables': failed_tables,
                 'execution_time': execution_time,
                 'backup_created': backup_path,
@@ -401,16 +411,35 @@ class ReplicationManager:
             }
             
         except Exception as e:
-            # Reabilita FKs em caso de erro
-            try:
-                if self.target_db:
-                    self.target_db.enable_foreign_key_checks()
-            except:
-                pass
-            
             self.logger.error(f"Erro crítico durante replicação: {e}")
             raise ReplicationError(f"Falha na replicação: {e}")
     
+    async def execute_replication_async(self, tables: Optional[List[str]] = None,
+                                        create_backup: bool = True,
+                                        replicate_data: bool = False,
+                                        max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Versão assíncrona de execute_replication para uso dentro de um event loop
+        
+        A replicação roda em uma thread do executor padrão, sem bloquear o loop;
+        as tabelas continuam sendo replicadas em paralelo pelo pool de threads de
+        execute_replication (todas de uma vez, com as FKs adicionadas ao final).
+        
+        Args:
+            tables (List[str], optional): Lista de tabelas específicas
+            create_backup (bool): Se deve criar backup antes da replicação
+            replicate_data (bool): Se deve replicar dados das tabelas maintain
+            max_workers (int, optional): Tabelas replicadas em paralelo
+            
+        Returns:
+            Dict[str, Any]: Resultado da replicação
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(self.execute_replication, tables, create_backup, replicate_data, max_workers)
+        )
+    
     def _remove_foreign_keys_from_create_statement(self, create_statement: str) -> str:
         """
         Remove definições de chaves estrangeiras de um statement CREATE TABLE
@@ -421,30 +450,7 @@ class ReplicationManager:
         Returns:
             str: Statement modificado sem FKs
         """
-        lines = create_statement.split('\n')
-        filtered_lines = []
-        
-        for line in lines:
-            line_lower = line.lower().strip()
-            
-            # Skip linhas que definem foreign keys
-            if (line_lower.startswith('constraint') and 'foreign key' in line_lower) or \
-               (line_lower.startswith('foreign key')) or \
-               ('references' in line_lower and 'foreign' in line_lower):
-                continue
-            
-            # Remove vírgulas órfãs
-            if line.strip() == ',':
-                continue
-                
-            filtered_lines.append(line)
-        
-        # Remove última vírgula se necessário
-        result = '\n'.join(filtered_lines)
-        result = result.replace(',\n)', '\n)')
-        result = result.replace(', )', ' )')
-        
-        return result
+        return FOREIGN_KEY_CLAUSE_PATTERN.sub('', create_statement)
     
     def validate_replication(self, tables: Optional[List[str]] = None) -> Dict[str, Any]:
         """
@@ -459,10 +465,14 @@ class ReplicationManager:
         try:
             self.logger.info("Validando replicação...")
             
+            # Metadados em cache valem apenas dentro de uma execução
+            self.source_db.invalidate()
+            self.target_db.invalidate()
+            
             if not tables:
                 tables = self.config_manager.get_maintain_tables()
                 if not tables:
-                    tables = self.source_db.get_tables()
+                    tables = self.source_db.get_tables(cached=True)
             
             validation_report = {
                 'timestamp': datetime.now().isoformat(),
@@ -472,7 +482,12 @@ class ReplicationManager:
                 'missing_tables': []
             }
             
-            target_tables = self.target_db.get_tables()
+            target_tables = set(self.target_db.get_tables(cached=True))
+            
+            # Estruturas de todas as tabelas com uma consulta por banco
+            existing_tables = [table for table in tables if table in target_tables]
+            source_structures = self.source_db.get_table_structures_bulk(existing_tables)
+            target_structures = self.target_db.get_table_structures_bulk(existing_tables)
             
             for table in tables:
                 try:
@@ -480,15 +495,11 @@ class ReplicationManager:
                         validation_report['missing_tables'].append(table)
                         continue
                     
-                    # Obtém estruturas
-                    source_structure = self.source_db.get_table_structure(table)
-                    target_structure = self.target_db.get_table_structure(table)
-                    
-                    # Compara estruturas (ignora FKs)
-                    source_basic = self._normalize_structure_for_comparison(source_structure)
-                    target_basic = self._normalize_structure_for_comparison(target_structure)
+                    # Compara estruturas (ignora FKs) pelo hash; detalha apenas as diferentes
+                    source_basic = self._normalize_structure_for_comparison(source_structures.get(table, []))
+                    target_basic = self._normalize_structure_for_comparison(target_structures.get(table, []))
                     
-                    if source_basic == target_basic:
+                    if self._structure_digest(source_basic) == self._structure_digest(target_basic):
                         validation_report['structure_matches'].append(table)
                     else:
                         validation_report['structure_differences'].append({
@@ -516,373 +527,514 @@ class ReplicationManager:
             self.logger.error(f"Erro durante validação: {e}")
             raise ReplicationError(f"Falha na validação: {e}")
     
-    def _replicate_table_data(self, table_name: str, batch_size: int = 1000) -> None:
+    def _replicate_table_data(self, table_name: str, batch_size: Optional[int] = None,
+                              clear_target: bool = True) -> None:
         """
         Replica os dados de uma tabela específica do banco origem para o destino
         
         Args:
             table_name (str): Nome da tabela
-            batch_size (int): Tamanho do lote para processamento
+            batch_size (int, optional): Tamanho do lote (padrão: settings.batch_size)
+            clear_target (bool): Limpa a tabela destino antes da cópia; False quando
+                ela acabou de ser recriada e já está vazia
         """
+        batch_size = batch_size or self.config_manager.get_batch_size()
+        
         try:
             self.logger.debug(f"Iniciando replicação de dados da tabela {table_name}")
             
-            # Configurar modo SQL para preservar valores 0 em colunas AUTO_INCREMENT
-            self.target_db.set_zero_preserve_mode(True)
-            
-            # Verificar se a tabela tem campo AUTO_INCREMENT
-            table_structure = self.target_db.get_table_structure(table_name)
+            # Verificar se a tabela tem campo AUTO_INCREMENT (IDs=0 são preservados pelo
+            # sql_mode NO_AUTO_VALUE_ON_ZERO da sessão de carga, sem alterar a coluna).
+            # A estrutura da origem já está em cache e o destino foi criado a partir dela
+            table_structure = self.source_db.get_table_structure(table_name)
             auto_increment_field = None
             for col in table_structure:
                 if col.get('Extra', '').lower() == 'auto_increment':
                     auto_increment_field = col['Field']
                     break
             
-            # NOVA ESTRATÉGIA: Para preservar IDs=0, desabilitar AUTO_INCREMENT temporariamente
-            needs_auto_increment_fix = False
-            original_auto_increment_value = None
-            
-            if auto_increment_field:
-                # Verifica se há registros com ID=0 na origem
-                check_zero_query = f"SELECT COUNT(*) as count FROM `{table_name}` WHERE `{auto_increment_field}` = 0"
-                zero_result = self.source_db.execute_query(check_zero_query)
-                has_zero_id = zero_result[0]['count'] > 0 if zero_result else False
-                
-                if has_zero_id:
-                    self.logger.info(f"🚨 Tabela {table_name} tem registros com {auto_increment_field}=0, aplicando correção especial...")
-                    needs_auto_increment_fix = True
-                    
-                    # Salva o valor atual do AUTO_INCREMENT
-                    show_create_query = f"SHOW CREATE TABLE `{table_name}`"
-                    create_result = self.target_db.execute_query(show_create_query)
-                    if create_result:
-                        create_table_sql = create_result[0]['Create Table']
-                        import re
-                        match = re.search(r'AUTO_INCREMENT=(\d+)', create_table_sql)
-                        if match:
-                            original_auto_increment_value = int(match.group(1))
-                            self.logger.info(f"💾 Valor original AUTO_INCREMENT: {original_auto_increment_value}")
-                    
-                    # Remove o AUTO_INCREMENT temporariamente
-                    self.logger.info(f"🔧 Removendo AUTO_INCREMENT temporariamente da coluna {auto_increment_field}...")
-                    
-                    # Obtém definição completa da coluna
-                    column_def = None
-                    for col in table_structure:
-                        if col['Field'] == auto_increment_field:
-                            null_part = "NOT NULL" if col['Null'] == 'NO' else "NULL"
-                            column_def = f"`{col['Field']}` {col['Type']} {null_part}"
-                            break
-                    
-                    if column_def:
-                        alter_remove_query = f"ALTER TABLE `{table_name}` MODIFY COLUMN {column_def}"
-                        self.target_db.execute_query(alter_remove_query, fetch_results=False)
-                        self.logger.info(f"✅ AUTO_INCREMENT removido temporariamente")
-            
             # LIMPA os dados da tabela destino para garantir dados idênticos
-            self.logger.debug(f"Limpando dados existentes da tabela {table_name} no destino")
-            self.target_db.execute_query(f"DELETE FROM `{table_name}`", fetch_results=False)
-            
-            # Conta total de registros na origem
-            count_query = f"SELECT COUNT(*) as total FROM `{table_name}`"
-            total_rows = self.source_db.execute_query(count_query)[0]['total']
+            if clear_target:
+                self.logger.debug(f"Limpando dados existentes da tabela {table_name} no destino")
+                self.target_db.truncate_table(table_name)
             
-            if total_rows == 0:
+            # Verifica se há registros na origem (LIMIT 1 lê uma linha; COUNT(*) varreria o índice)
+            if not self.source_db.execute_query_tuples(f"SELECT 1 FROM `{table_name}` LIMIT 1"):
                 self.logger.debug(f"Tabela {table_name} está vazia, nenhum dado para replicar")
                 return
             
-            self.logger.debug(f"Replicando {total_rows} registros da tabela {table_name}")
+            # Total aproximado (estatística do information_schema), usado no progresso e
+            # para decidir se os índices secundários são adiados
+            try:
+                estimated_rows = self.source_db.get_table_row_estimate(table_name)
+            except Exception as e:
+                self.logger.debug(f"Estimativa de linhas de {table_name} indisponível: {e}")
+                estimated_rows = 0
+            
+            self.logger.debug(f"Replicando cerca de {estimated_rows} registros da tabela {table_name}")
             
             # Obtém estrutura da tabela para montar INSERT
             columns = self.source_db.get_table_columns(table_name)
             column_names = [col['name'] for col in columns]
             
             # Monta queries - usa REPLACE INTO para garantir que IDs específicos sejam preservados
-            select_query = f"SELECT * FROM `{table_name}` LIMIT %s OFFSET %s"
-            
-            # Para tabelas com AUTO_INCREMENT, usar INSERT INTO simples já que removemos o AUTO_INCREMENT
-            if needs_auto_increment_fix:
-                insert_query = f"INSERT INTO `{table_name}` ({', '.join([f'`{col}`' for col in column_names])}) VALUES ({', '.join(['%s'] * len(column_names))})"
-                self.logger.info(f"🔧 TABELA {table_name}: Usando INSERT INTO (AUTO_INCREMENT temporariamente removido)")
-            elif auto_increment_field:
-                insert_query = f"REPLACE INTO `{table_name}` ({', '.join([f'`{col}`' for col in column_names])}) VALUES ({', '.join(['%s'] * len(column_names))})"
+            columns_sql = ', '.join([f'`{col}`' for col in column_names])
+            placeholders = ', '.join(['%s'] * len(column_names))
+            if auto_increment_field:
+                insert_query = f"REPLACE INTO `{table_name}` ({columns_sql}) VALUES ({placeholders})"
                 self.logger.info(f"🔧 TABELA {table_name}: Usando REPLACE INTO para preservar IDs")
             else:
-                insert_query = f"INSERT INTO `{table_name}` ({', '.join([f'`{col}`' for col in column_names])}) VALUES ({', '.join(['%s'] * len(column_names))})"
+                insert_query = f"INSERT INTO `{table_name}` ({columns_sql}) VALUES ({placeholders})"
                 self.logger.info(f"🔧 TABELA {table_name}: Usando INSERT INTO normal")
             
-            # Processa em lotes
+            # Processa em lotes, lendo a origem em streaming (linhas já na ordem de column_names)
             processed = 0
+            auto_increment_index = column_names.index(auto_increment_field) if auto_increment_field in column_names else None
+            use_replace = bool(auto_increment_field)
             
-            with tqdm(total=total_rows, desc=f"Dados {table_name}", leave=False) as data_pbar:
-                while processed < total_rows:
-                    # Busca lote de dados
-                    batch_data = self.source_db.execute_query(select_query, (batch_size, processed))
-                    
-                    if not batch_data:
-                        break
-                    
-                    # Prepara dados para inserção
-                    batch_values = []
-                    for row in batch_data:
-                        # Converte row dict para lista ordenada de valores
-                        row_values = [row.get(col) for col in column_names]
-                        batch_values.append(row_values)
-                        
+            # Progresso em linhas, redesenhado no máximo a cada 0,5 s e sem média móvel
+            with tqdm(total=estimated_rows or None, desc=f"Dados {table_name}", leave=False,
+                      unit="linha", unit_scale=True, mininterval=0.5, smoothing=0) as data_pbar:
+                
+                def source_batches():
+                    for batch_values in self.source_db.iter_table_data(
+                        table_name, batch_size, column_names,
+                        prefetch=STREAM_PREFETCH_BATCHES, max_batch_bytes=STREAM_BATCH_MAX_BYTES
+                    ):
                         # Log detalhado para registros com ID = 0
-                        if auto_increment_field and row.get(auto_increment_field) == 0:
-                            self.logger.info(f"📝 INSERINDO REGISTRO ID=0: {dict(zip(column_names, row_values))}")
-                    
-                    # Insere lote no destino
-                    self.target_db.execute_many_query(insert_query, batch_values)
-                    
-                    processed += len(batch_data)
-                    data_pbar.update(len(batch_data))
-            
-            # Restaura AUTO_INCREMENT se foi removido
-            if needs_auto_increment_fix and auto_increment_field:
-                # PRIMEIRO: Verifica se os IDs=0 foram preservados (antes de restaurar AUTO_INCREMENT)
-                check_query = f"SELECT COUNT(*) as count FROM `{table_name}` WHERE `{auto_increment_field}` = 0"
-                result = self.target_db.execute_query(check_query)
-                zero_count = result[0]['count'] if result else 0
+                        if auto_increment_index is not None:
+                            for row_values in batch_values:
+                                if row_values[auto_increment_index] == 0:
+                                    self.logger.info(f"📝 INSERINDO REGISTRO ID=0: {dict(zip(column_names, row_values))}")
+                        
+                        data_pbar.update(len(batch_values))
+                        yield batch_values
                 
-                if zero_count > 0:
-                    self.logger.info(f"✅ {zero_count} registro(s) com ID=0 preservados com sucesso!")
+                # Em tabelas grandes, índices secundários são reconstruídos de uma vez após a
+                # carga; nas pequenas, os dois ALTER TABLE custariam mais que mantê-los
+                index_context = (
+                    self.target_db.deferred_secondary_indexes(table_name)
+                    if estimated_rows >= DEFER_INDEXES_MIN_ROWS else nullcontext()
+                )
+                with index_context:
+                    loaded = False
                     
-                    # DECISÃO CRÍTICA: NÃO restaurar AUTO_INCREMENT se há registros com ID=0
-                    # pois o MySQL irá converter ID=0 para o próximo valor disponível
-                    self.logger.warning(f"⚠️ AUTO_INCREMENT NÃO será restaurado para preservar IDs com valor 0")
-                    self.logger.warning(f"⚠️ Tabela {table_name} ficará sem AUTO_INCREMENT para manter integridade dos dados")
-                    
-                else:
-                    self.logger.info(f"🔧 Restaurando AUTO_INCREMENT na coluna {auto_increment_field}...")
+                    # Origem e destino no mesmo servidor: INSERT ... SELECT entre schemas
+                    if self._is_same_server():
+                        try:
+                            processed = self.target_db.copy_table_from_schema(
+                                self.source_db.config.dbname, table_name, column_names, replace=use_replace
+                            )
+                            data_pbar.update(processed)
+                            loaded = True
+                        except DatabaseOperationError as e:
+                            self.logger.warning(f"INSERT ... SELECT indisponível para {table_name}, usando o caminho padrão: {e}")
                     
-                    # Obtém definição completa da coluna com AUTO_INCREMENT
-                    column_def = None
-                    for col in table_structure:
-                        if col['Field'] == auto_increment_field:
-                            null_part = "NOT NULL" if col['Null'] == 'NO' else "NULL"
-                            column_def = f"`{col['Field']}` {col['Type']} {null_part} AUTO_INCREMENT"
-                            break
+                    # Tabelas grandes: mysqldump | mysql, sem que as linhas passem pelo Python
+                    if not loaded and self._should_copy_via_dump(table_name):
+                        try:
+                            self._get_source_backup_manager().copy_table_data_to(
+                                self.backup_manager, table_name, replace=use_replace
+                            )
+                            # O mysqldump não informa as linhas copiadas: usa a estimativa
+                            processed = estimated_rows
+                            data_pbar.update(estimated_rows)
+                            loaded = True
+                        except BackupError as e:
+                            self.logger.warning(f"Cópia via mysqldump falhou para {table_name}, usando o caminho padrão: {e}")
+                            self.target_db.truncate_table(table_name)
                     
-                    if column_def:
-                        alter_restore_query = f"ALTER TABLE `{table_name}` MODIFY COLUMN {column_def}"
-                        self.target_db.execute_query(alter_restore_query, fetch_results=False)
+                    # Caminho rápido: carregador em massa do MySQL (LOAD DATA LOCAL INFILE)
+                    if not loaded and self.target_db.supports_local_infile():
+                        try:
+                            self.target_db.load_data_local(table_name, column_names, source_batches(), replace=use_replace)
+                            processed = data_pbar.n
+                            loaded = True
+                        except DatabaseOperationError as e:
+                            self.logger.warning(f"LOAD DATA indisponível para {table_name}, usando INSERT em lotes: {e}")
+                            self.target_db.truncate_table(table_name)
+                            data_pbar.reset()
                     
-                    # Restaura o valor do AUTO_INCREMENT
-                    if original_auto_increment_value is not None:
-                        # Ajusta para o próximo valor disponível
-                        max_id_query = f"SELECT COALESCE(MAX(`{auto_increment_field}`), 0) as max_id FROM `{table_name}`"
-                        max_result = self.target_db.execute_query(max_id_query)
-                        current_max = max_result[0]['max_id'] if max_result else 0
-                        next_auto_increment = max(current_max + 1, original_auto_increment_value)
-                        
-                        alter_increment_query = f"ALTER TABLE `{table_name}` AUTO_INCREMENT = {next_auto_increment}"
-                        self.target_db.execute_query(alter_increment_query, fetch_results=False)
-                        self.logger.info(f"✅ AUTO_INCREMENT restaurado para: {next_auto_increment}")
-                        
-            else:
-                # Se não há correção especial, verifica se há registros com ID=0
-                if auto_increment_field:
-                    check_query = f"SELECT COUNT(*) as count FROM `{table_name}` WHERE `{auto_increment_field}` = 0"
-                    result = self.target_db.execute_query(check_query)
-                    zero_count = result[0]['count'] if result else 0
-                    if zero_count > 0:
-                        self.logger.info(f"✅ {zero_count} registro(s) com ID=0 preservados!")
-                    else:
-                        self.logger.debug(f"ℹ️ Nenhum registro com ID=0 na tabela {table_name}")
+                    if not loaded:
+                        # Todos os lotes em uma única transação, confirmada ao final
+                        with self.target_db.bulk_load() as bulk_conn:
+                            for batch_values in source_batches():
+                                # Insere lote no destino
+                                self.target_db.execute_many_query(
+                                    insert_query, batch_values, conn=bulk_conn, prepared=True
+                                )
+                                processed += len(batch_values)
             
             self.logger.debug(f"Dados da tabela {table_name} replicados com sucesso: {processed} registros")
             
-            # Restaurar modo SQL padrão
-            self.target_db.set_zero_preserve_mode(False)
-            
         except Exception as e:
-            # Restaurar modo SQL padrão em caso de erro
-            try:
-                self.target_db.set_zero_preserve_mode(False)
-            except:
-                pass
-                
             self.logger.error(f"Erro ao replicar dados da tabela {table_name}: {e}")
             raise DatabaseOperationError(f"Falha na replicação de dados de {table_name}: {e}")
     
-    def _normalize_structure_for_comparison(self, structure: List[Dict]) -> List[Dict]:
-        """Normaliza estrutura de tabela para comparação (remove informações de FK)"""
-        normalized = []
-        for column in structure:
-            normalized.append({
-                'Field': column['Field'],
-                'Type': column['Type'],
-                'Null': column['Null'],
-                'Default': column['Default'],
-                'Extra': column['Extra']
-            })
-        return normalized
+    def _get_source_backup_manager(self) -> BackupManager:
+        """Cria (uma única vez) o gerenciador de backup do banco de origem, usado no mysqldump"""
+        if self._source_backup_manager is None:
+            self._source_backup_manager = BackupManager(
+                self.source_db, self.logger, self.config_manager.get_backup_path()
+            )
+        return self._source_backup_manager
     
-    def _find_structure_differences(self, source: List[Dict], target: List[Dict]) -> List[str]:
-        """Encontra diferenças entre duas estruturas de tabela"""
-        differences = []
+    def _is_same_server(self) -> bool:
+        """
+        Verifica (uma única vez) se origem e destino são schemas diferentes do mesmo servidor
         
-        source_fields = {col['Field']: col for col in source}
-        target_fields = {col['Field']: col for col in target}
+        Returns:
+            bool: True se os dados podem ser copiados com INSERT ... SELECT entre schemas
+        """
+        if self._same_server is None:
+            try:
+                self._same_server = (
+                    self.source_db.config.dbname != self.target_db.config.dbname
+                    and self.source_db.get_server_identity() == self.target_db.get_server_identity()
+                )
+            except Exception as e:
+                self.logger.debug(f"Identidade dos servidores indisponível: {e}")
+                self._same_server = False
+            
+            if self._same_server:
+                self.logger.info("Origem e destino no mesmo servidor: dados copiados com INSERT ... SELECT")
         
-        # Campos apenas no source
-        for field in source_fields:
-            if field not in target_fields:
-                differences.append(f"Campo '{field}' existe no origem mas não no destino")
+        return self._same_server
+    
+    def _should_copy_via_dump(self, table_name: str) -> bool:
+        """
+        Verifica se os dados da tabela devem ser copiados via mysqldump | mysql
         
-        # Campos apenas no target
-        for field in target_fields:
-            if field not in source_fields:
-                differences.append(f"Campo '{field}' existe no destino mas não no origem")
+        Args:
+            table_name (str): Nome da tabela
+            
+        Returns:
+            bool: True para tabelas grandes quando os clientes MySQL estão instalados
+        """
+        if self._dump_pipe_available is None:
+            self._dump_pipe_available = bool(shutil.which("mysqldump") and shutil.which("mysql"))
         
-        # Campos com diferenças
-        for field in source_fields:
-            if field in target_fields:
-                if source_fields[field] != target_fields[field]:
-                    differences.append(f"Campo '{field}' tem definição diferente")
+        if not self._dump_pipe_available:
+            return False
+        
+        try:
+            return self.source_db.get_table_size(table_name) >= DUMP_PIPE_MIN_BYTES
+        except Exception as e:
+            self.logger.debug(f"Tamanho de {table_name} indisponível: {e}")
+            return False
+    
+    def _normalize_structure_for_comparison(self, structure: List[Dict]) -> Tuple[Tuple, ...]:
+        """Normaliza estrutura de tabela para comparação (remove informações de FK)"""
+        return tuple(
+            (column['Field'], column['Type'], column['Null'], column['Default'], column['Extra'])
+            for column in structure
+        )
+    
+    @staticmethod
+    def _structure_digest(structure: Tuple[Tuple, ...]) -> bytes:
+        """Calcula o hash de uma estrutura normalizada"""
+        return hashlib.blake2b(repr(structure).encode('utf-8'), digest_size=16).digest()
+    
+    def _find_structure_differences(self, source: Tuple[Tuple, ...], target: Tuple[Tuple, ...]) -> List[str]:
+        """Encontra diferenças entre duas estruturas de tabela"""
+        source_fields = {col[0]: col for col in source}
+        target_fields = {col[0]: col for col in target}
+        only_source = source_fields.keys() - target_fields.keys()
+        only_target = target_fields.keys() - source_fields.keys()
+        
+        # Campos apenas no source, apenas no target e com definições diferentes
+        differences = [f"Campo '{field}' existe no origem mas não no destino" for field in source_fields if field in only_source]
+        differences += [f"Campo '{field}' existe no destino mas não no origem" for field in target_fields if field in only_target]
+        differences += [
+            f"Campo '{field}' tem definição diferente"
+            for field, column in source_fields.items()
+            if field not in only_source and column != target_fields[field]
+        ]
         
         return differences
     
-    def _sort_tables_by_dependencies(self, tables: List[str]) -> List[str]:
+    def _clean_create_statement_for_temp(self, create_statement: str, temp_table_name: str) -> str:
         """
-        Ordena tabelas por dependências de Foreign Keys para evitar erros de criação
+        Remove restrições de FK do statement CREATE para tabela temporária
         
         Args:
-            tables (List[str]): Lista de tabelas para ordenar
+            create_statement (str): Statement CREATE original
+            temp_table_name (str): Nome da tabela temporária
             
         Returns:
-            List[str]: Tabelas ordenadas por dependência
+            str: Statement CREATE limpo para tabela temporária
+        """
+        # Remove as FKs (com a vírgula que as precede) e troca o nome da tabela
+        without_foreign_keys = FOREIGN_KEY_CLAUSE_PATTERN.sub('', create_statement)
+        return CREATE_TABLE_NAME_PATTERN.sub(
+            lambda _: f"CREATE TABLE `{temp_table_name}`", without_foreign_keys, count=1
+        )
+    
+    def _find_unchanged_tables(self, tables: List[str],
+                               source_descriptions: Dict[str, Dict[str, Any]],
+                               maintain_tables: Set[str]) -> Set[str]:
+        """
+        Identifica tabelas que já estão idênticas no destino
+        
+        Compara o hash da estrutura (CREATE TABLE normalizado) de todas as tabelas
+        e, para as tabelas maintain, também o CHECKSUM TABLE dos dados.
+        
+        Args:
+            tables (List[str]): Tabelas existentes na origem e no destino
+            source_descriptions (Dict[str, Dict[str, Any]]): Descrições obtidas da origem
+            maintain_tables (Set[str]): Tabelas cujos dados também são replicados
+            
+        Returns:
+            Set[str]: Tabelas que podem ser ignoradas
         """
         try:
-            self.logger.debug("Analisando dependências de Foreign Keys...")
+            same_structure = []
+            for table_name in tables:
+                description = source_descriptions.get(table_name)
+                source_fingerprint = self.source_db.get_structure_fingerprint(
+                    table_name, description['create_statement'] if description else None
+                )
+                if source_fingerprint == self.target_db.get_structure_fingerprint(table_name):
+                    same_structure.append(table_name)
+            
+            unchanged = {table_name for table_name in same_structure if table_name not in maintain_tables}
+            
+            # Tabelas maintain: os dados também precisam ser iguais
+            maintain_candidates = [table_name for table_name in same_structure if table_name in maintain_tables]
+            if maintain_candidates:
+                source_checksums = self.source_db.get_table_checksums(maintain_candidates)
+                target_checksums = self.target_db.get_table_checksums(maintain_candidates)
+                for table_name in maintain_candidates:
+                    checksum = source_checksums.get(table_name)
+                    target_checksum = target_checksums.get(table_name)
+                    
+                    if checksum is not None and target_checksum is not None:
+                        if checksum == target_checksum:
+                            unchanged.add(table_name)
+                    else:
+                        # CHECKSUM TABLE indisponível: compara o hash agregado das linhas
+                        columns = [col['name'] for col in self.source_db.get_table_columns(table_name)]
+                        if (self.source_db.compute_content_hash(table_name, columns)
+                                == self.target_db.compute_content_hash(table_name, columns)):
+                            unchanged.add(table_name)
             
-            # Mapa de dependências: tabela -> tabelas que ela depende
-            dependencies = {}
+            self.logger.debug(f"Tabelas inalteradas no destino: {len(unchanged)}")
+            return unchanged
             
-            # Analisa cada tabela para encontrar FKs
-            for table in tables:
-                dependencies[table] = []
-                try:
-                    # Obtém informações de FKs da tabela
-                    fk_query = """
-                        SELECT 
-                            REFERENCED_TABLE_NAME
-                        FROM 
-                            information_schema.KEY_COLUMN_USAGE 
-                        WHERE 
-                            TABLE_SCHEMA = DATABASE() 
-                            AND TABLE_NAME = %s
-                            AND REFERENCED_TABLE_NAME IS NOT NULL
-                    """
-                    fk_results = self.source_db.execute_query(fk_query, (table,))
-                    
-                    for fk_row in fk_results:
-                        referenced_table = fk_row.get('REFERENCED_TABLE_NAME')
-                        if referenced_table and referenced_table in tables and referenced_table != table:
-                            dependencies[table].append(referenced_table)
-                            
-                except Exception as e:
-                    self.logger.debug(f"Erro ao analisar FKs de {table}: {e}")
-            
-            # Ordenação topológica
-            ordered_tables = []
-            visited = set()
-            temp_visited = set()
-            
-            def visit(table):
-                if table in temp_visited:
-                    # Dependência circular - ignora e continua
-                    return
-                if table in visited:
-                    return
-                    
-                temp_visited.add(table)
-                
-                # Visita dependências primeiro
-                for dep_table in dependencies.get(table, []):
-                    if dep_table in tables:
-                        visit(dep_table)
-                
-                temp_visited.remove(table)
-                visited.add(table)
-                ordered_tables.append(table)
+        except Exception as e:
+            self.logger.warning(f"Não foi possível comparar tabelas com o destino: {e}")
+            return set()
+    
+    def _defer_foreign_keys(self, tables: List[str],
+                            source_descriptions: Dict[str, Dict[str, Any]],
+                            maintain_tables: Set[str],
+                            existing_target_tables: Set[str],
+                            unchanged_tables: Set[str]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[str]]]:
+        """
+        Separa as FKs do CREATE TABLE das tabelas que serão criadas do zero
+        
+        Args:
+            tables (List[str]): Tabelas da replicação
+            source_descriptions (Dict[str, Dict[str, Any]]): Descrições obtidas da origem
+            maintain_tables (Set[str]): Tabelas cujos dados também são replicados
+            existing_target_tables (Set[str]): Tabelas que já existem no destino
+            unchanged_tables (Set[str]): Tabelas ignoradas por estarem idênticas
             
-            # Processa todas as tabelas
-            for table in tables:
-                if table not in visited:
-                    visit(table)
+        Returns:
+            Tuple: (descrições com o CREATE TABLE sem FKs, cláusulas de FK adiadas por tabela)
+        """
+        descriptions = dict(source_descriptions)
+        deferred_foreign_keys = {}
+        
+        for table_name in tables:
+            description = source_descriptions.get(table_name)
+            if (not description or table_name in unchanged_tables
+                    or (table_name not in maintain_tables and table_name in existing_target_tables)):
+                continue
             
-            self.logger.info(f"Tabelas ordenadas por dependências: {len(ordered_tables)} tabelas")
-            return ordered_tables
+            create_statement = description['create_statement']
+            clauses = [
+                match.group(0).lstrip(',').strip()
+                for match in FOREIGN_KEY_CLAUSE_PATTERN.finditer(create_statement)
+            ]
+            if clauses:
+                descriptions[table_name] = {
+                    **description,
+                    'create_statement': FOREIGN_KEY_CLAUSE_PATTERN.sub('', create_statement)
+                }
+                deferred_foreign_keys[table_name] = clauses
+        
+        return descriptions, deferred_foreign_keys
+    
+    def _recreate_tables_batch(self, tables: List[str],
+                               descriptions: Dict[str, Dict[str, Any]],
+                               maintain_tables: Set[str],
+                               existing_target_tables: Set[str],
+                               unchanged_tables: Set[str]) -> Set[str]:
+        """
+        Recria em lote no destino as tabelas que serão (re)criadas do zero
+        
+        Tabelas maintain e tabelas ausentes no destino têm DROP + CREATE enviados em
+        um único comando. Se o lote falhar, cada tabela segue o caminho individual.
+        
+        Args:
+            tables (List[str]): Tabelas da replicação
+            descriptions (Dict[str, Dict[str, Any]]): Descrições com o CREATE TABLE a usar
+            maintain_tables (Set[str]): Tabelas cujos dados também são replicados
+            existing_target_tables (Set[str]): Tabelas que já existem no destino
+            unchanged_tables (Set[str]): Tabelas ignoradas por estarem idênticas
             
+        Returns:
+            Set[str]: Tabelas já recriadas no destino
+        """
+        create_statements = {
+            table_name: descriptions[table_name]['create_statement']
+            for table_name in tables
+            if table_name not in unchanged_tables
+            and table_name in descriptions
+            and (table_name in maintain_tables or table_name not in existing_target_tables)
+        }
+        
+        if not create_statements:
+            return set()
+        
+        try:
+            self.target_db.recreate_tables(create_statements)
+            return set(create_statements)
         except Exception as e:
-            self.logger.warning(f"Erro ao ordenar tabelas por dependência: {e}")
-            # Se falhar, retorna ordem original
-            return tables
-
-    def _clean_create_statement_for_temp(self, create_statement: str, temp_table_name: str) -> str:
+            self.logger.debug(f"Recriação em lote falhou, recriando tabelas individualmente: {e}")
+            
+            # Desfaz tabelas novas criadas antes da falha: o caminho individual apenas as cria
+            for table_name in create_statements:
+                if table_name not in existing_target_tables:
+                    try:
+                        self.target_db.drop_table_if_exists(table_name)
+                    except Exception:
+                        pass
+            return set()
+    
+    def _replicate_one_table(self, table_plan: Dict[str, Any],
+                             description: Optional[Dict[str, Any]],
+                             is_maintain_table: bool,
+                             table_exists: bool,
+                             replicate_data: bool,
+                             structure_ready: bool = False) -> Dict[str, Any]:
         """
-        Remove restrições de FK do statement CREATE para tabela temporária
+        Replica uma única tabela (executado em paralelo por execute_replication)
         
         Args:
-            create_statement (str): Statement CREATE original
-            temp_table_name (str): Nome da tabela temporária
+            table_plan (Dict[str, Any]): Entrada do plano de replicação
+            description (Dict[str, Any], optional): Descrição obtida em paralelo da origem
+            is_maintain_table (bool): Se a tabela é maintain (estrutura + dados)
+            table_exists (bool): Se a tabela já existe no destino
+            replicate_data (bool): Se deve replicar dados das tabelas maintain
+            structure_ready (bool): Se a tabela já foi recriada no destino em lote
             
         Returns:
-            str: Statement CREATE limpo para tabela temporária
+            Dict[str, Any]: Resultado com as chaves 'replicated', 'data_replicated' e 'failed'
         """
+        table_name = table_plan['name']
+        result = {'replicated': None, 'data_replicated': False, 'failed': None}
+        create_statement = None
+        
         try:
-            lines = create_statement.split('\n')
-            cleaned_lines = []
+            # Obtém estrutura da tabela de origem (consulta de novo se a leitura paralela falhou)
+            if description:
+                create_statement = description['create_statement']
+            else:
+                create_statement = self.source_db.get_create_table_statement(table_name)
             
-            for line in lines:
-                line_stripped = line.strip()
+            if is_maintain_table:
+                # TABELAS MAINTAIN: Remove completamente e recria com dados de origem
+                self.logger.debug(f"Tabela MAINTAIN {table_name}: replicando estrutura + dados")
                 
-                # Substituir nome da tabela pelo nome temporário
-                if 'CREATE TABLE' in line_stripped:
-                    # Encontrar e substituir o nome da tabela
-                    import re
-                    line = re.sub(r'CREATE TABLE `([^`]+)`', f'CREATE TABLE `{temp_table_name}`', line)
-                    cleaned_lines.append(line)
-                # Pular linhas que contêm restrições de FK
-                elif (line_stripped.startswith('CONSTRAINT') and 'FOREIGN KEY' in line_stripped) or \
-                     line_stripped.startswith('FOREIGN KEY') or \
-                     (line_stripped.startswith('KEY') and 'FOREIGN' in line_stripped) or \
-                     line_stripped.startswith('ADD CONSTRAINT'):
-                    continue
-                # Linha de fechamento da tabela
-                elif line_stripped.startswith(')') and ('ENGINE=' in line_stripped or 'CHARSET=' in line_stripped):
-                    # Remover vírgula do final da linha anterior se existir
-                    if cleaned_lines and cleaned_lines[-1].strip().endswith(','):
-                        cleaned_lines[-1] = cleaned_lines[-1].rstrip().rstrip(',')
-                    cleaned_lines.append(line)
+                if not structure_ready:
+                    # Remove tabela no destino se existir
+                    self.target_db.drop_table_if_exists(table_name)
+                    
+                    # Cria tabela no destino
+                    self.target_db.create_table_from_statement(create_statement)
+                
+                # Replica os dados de origem (a tabela acabou de ser recriada, já está vazia)
+                try:
+                    self._replicate_table_data(table_name, clear_target=False)
+                    result['data_replicated'] = True
+                    result['replicated'] = f"{table_name} (estrutura + dados)"
+                    self.logger.debug(f"Tabela maintain {table_name} replicada com estrutura e dados")
+                except Exception as data_error:
+                    # Se falhar na replicação de dados, ainda marca como sucesso estrutural
+                    result['replicated'] = f"{table_name} (apenas estrutura)"
+                    self.logger.warning(f"Estrutura de {table_name} criada, mas falhou na replicação dos dados: {data_error}")
+            
+            else:
+                # TABELAS NÃO-MAINTAIN: Preserva dados existentes e atualiza apenas estrutura
+                self.logger.debug(f"Tabela NÃO-MAINTAIN {table_name}: preservando dados, atualizando estrutura")
+                
+                if table_exists:
+                    # Preserva os dados existentes durante atualização estrutural
+                    self._update_table_structure_preserving_data(table_name, create_statement)
+                    result['replicated'] = f"{table_name} (estrutura atualizada, dados preservados)"
+                    self.logger.debug(f"Tabela não-maintain {table_name}: estrutura atualizada, dados preservados")
                 else:
-                    cleaned_lines.append(line)
-            
-            # Verificar se há vírgula final antes do fechamento e remover se necessário
-            result_lines = []
-            for i, line in enumerate(cleaned_lines):
-                if i == len(cleaned_lines) - 1:  # Última linha
-                    result_lines.append(line)
-                elif i == len(cleaned_lines) - 2:  # Penúltima linha
-                    # Se a próxima linha é fechamento da tabela, remover vírgula final
-                    next_line = cleaned_lines[i + 1].strip()
-                    if next_line.startswith(')') and line.strip().endswith(','):
-                        result_lines.append(line.rstrip().rstrip(','))
+                    # Tabela não existe: cria nova apenas com estrutura (sem dados)
+                    if not structure_ready:
+                        self.target_db.create_table_from_statement(create_statement)
+                    result['replicated'] = f"{table_name} (nova estrutura criada)"
+                    self.logger.debug(f"Tabela não-maintain {table_name}: nova tabela criada (apenas estrutura)")
+            
+        except DatabaseOperationError as e:
+            # Se for erro relacionado a FK, tenta ignorar
+            if create_statement and ("foreign key" in str(e).lower() or "constraint" in str(e).lower()):
+                self.logger.warning(f"Erro de FK ignorado para {table_name}: {e}")
+                
+                # Tenta criar tabela sem FKs
+                try:
+                    modified_statement = self._remove_foreign_keys_from_create_statement(
+                        create_statement
+                    )
+                    
+                    self.target_db.drop_table_if_exists(table_name)
+                    self.target_db.create_table_from_statement(modified_statement)
+                    
+                    # Verifica se deve replicar dados mesmo sem FKs
+                    if is_maintain_table and replicate_data:
+                        try:
+                            self._replicate_table_data(table_name, clear_target=False)
+                            result['data_replicated'] = True
+                            result['replicated'] = f"{table_name} (sem FKs, estrutura + dados)"
+                        except Exception as data_error:
+                            result['replicated'] = f"{table_name} (sem FKs)"
+                            self.logger.warning(f"Dados de {table_name} não replicados: {data_error}")
                     else:
-                        result_lines.append(line)
-                else:
-                    result_lines.append(line)
-            
-            return '\n'.join(result_lines)
-            
+                        result['replicated'] = f"{table_name} (sem FKs)"
+                    
+                    self.logger.info(f"Tabela {table_name} criada sem chaves estrangeiras")
+                    
+                except Exception as e2:
+                    result['failed'] = {
+                        'table': table_name,
+                        'error': str(e2)
+                    }
+                    self.logger.error(f"Falha ao criar {table_name} mesmo sem FKs: {e2}")
+            else:
+                result['failed'] = {
+                    'table': table_name,
+                    'error': str(e)
+                }
+                self.logger.error(f"Erro ao replicar {table_name}: {e}")
+                self.logger.error(f"Tipo do erro: {type(e).__name__}")
+                self.logger.debug("Falha em %s", table_name, exc_info=True)
+        
         except Exception as e:
-            self.logger.warning(f"Erro ao limpar statement CREATE: {e}")
-            # Em caso de erro, apenas substitui o nome da tabela
-            import re
-            return re.sub(r'CREATE TABLE `([^`]+)`', f'CREATE TABLE `{temp_table_name}`', create_statement)
+            result['failed'] = {
+                'table': table_name,
+                'error': str(e)
+            }
+            self.logger.error(f"Erro inesperado ao replicar {table_name}: {e}")
+            self.logger.error(f"Tipo do erro: {type(e).__name__}")
+            self.logger.debug("Falha em %s", table_name, exc_info=True)
+        
+        return result
     
     def _update_table_structure_preserving_data(self, table_name: str, new_create_statement: str) -> None:
         """
@@ -899,90 +1051,69 @@ class ReplicationManager:
             self.logger.info(f"Atualizando estrutura da tabela {table_name} preservando dados...")
             
             # Nomes das tabelas temporárias
-            import random
             suffix = f"{int(time.time())}_{random.randint(1000, 9999)}"
             temp_table = f"temp_repl_{table_name}_{suffix}"
             backup_table = f"backup_repl_{table_name}_{suffix}"
             
-            # Desabilitar verificações de FK temporariamente
-            self.target_db.execute_query("SET FOREIGN_KEY_CHECKS = 0", fetch_results=False)
+            # 1. Criar tabela temporária com nova estrutura (sem FKs)
+            temp_create_statement = self._clean_create_statement_for_temp(new_create_statement, temp_table)
             
-            try:
-                # 1. Criar tabela temporária com nova estrutura (sem FKs)
-                temp_create_statement = self._clean_create_statement_for_temp(new_create_statement, temp_table)
-                
-                self.logger.debug(f"Criando tabela temporária {temp_table}")
-                self.target_db.create_table_from_statement(temp_create_statement)
-                
-                # 2. Obter estrutura da tabela original e nova
-                original_columns = [col['name'] for col in self.target_db.get_table_columns(table_name)]
-                new_columns = [col['name'] for col in self.target_db.get_table_columns(temp_table)]
-                
-                # 3. Encontrar colunas em comum
-                common_columns = [col for col in original_columns if col in new_columns]
-                
-                if common_columns:
-                    # Configurar modo SQL para preservar valores 0 em colunas AUTO_INCREMENT
-                    self.target_db.set_zero_preserve_mode(True)
-                    
-                    # 4. Copiar dados compatíveis para tabela temporária
-                    columns_str = ", ".join([f"`{col}`" for col in common_columns])
-                    
-                    copy_query = f"""
-                    INSERT INTO `{temp_table}` ({columns_str})
-                    SELECT {columns_str}
-                    FROM `{table_name}`
-                    """
-                    
-                    self.logger.debug(f"Copiando dados de {len(common_columns)} colunas comuns: {common_columns}")
-                    self.target_db.execute_query(copy_query, fetch_results=False)
-                    
-                    # Verifica quantos registros foram copiados
-                    count_query = f"SELECT COUNT(*) as count FROM `{temp_table}`"
-                    result = self.target_db.execute_query(count_query)
-                    copied_records = result[0]['count'] if result else 0
-                    
-                    self.logger.info(f"Copiados {copied_records} registros preservando dados existentes")
-                else:
-                    self.logger.warning(f"Nenhuma coluna em comum encontrada entre estruturas antiga e nova de {table_name}")
-                
-                # 5. Fazer backup da tabela original (para segurança)
-                self.logger.debug(f"Renomeando tabela original para backup: {backup_table}")
-                rename_to_backup_query = f"RENAME TABLE `{table_name}` TO `{backup_table}`"
-                self.target_db.execute_query(rename_to_backup_query, fetch_results=False)
-                
-                # 6. Renomear tabela temporária para o nome original
-                self.logger.debug(f"Renomeando tabela temporária {temp_table} para {table_name}")
-                rename_temp_query = f"RENAME TABLE `{temp_table}` TO `{table_name}`"
-                self.target_db.execute_query(rename_temp_query, fetch_results=False)
+            self.logger.debug(f"Criando tabela temporária {temp_table}")
+            self.target_db.create_table_from_statement(temp_create_statement)
+            
+            # 2. Obter estrutura da tabela original e nova
+            original_columns = [col['name'] for col in self.target_db.get_table_columns(table_name)]
+            new_columns = [col['name'] for col in self.target_db.get_table_columns(temp_table)]
+            
+            # 3. Encontrar colunas em comum
+            common_columns = [col for col in original_columns if col in new_columns]
+            
+            if common_columns:
+                # 4. Copiar dados compatíveis para tabela temporária
+                columns_str = ", ".join([f"`{col}`" for col in common_columns])
                 
-                # Marcar temp_table como None já que foi renomeado
-                temp_table = None
+                copy_query = f"""
+                INSERT INTO `{temp_table}` ({columns_str})
+                SELECT {columns_str}
+                FROM `{table_name}`
+                """
                 
-                # 7. Remover tabela de backup (opcional - pode manter para segurança)
-                self.logger.debug(f"Removendo tabela de backup {backup_table}")
-                self.target_db.drop_table_if_exists(backup_table)
-                backup_table = None
+                self.logger.debug(f"Copiando dados de {len(common_columns)} colunas comuns: {common_columns}")
                 
-                self.logger.info(f"Estrutura de {table_name} atualizada com sucesso, dados preservados")
-                
-            finally:
-                # Reabilitar verificações de FK
-                self.target_db.execute_query("SET FOREIGN_KEY_CHECKS = 1", fetch_results=False)
-                # Restaurar modo SQL padrão
-                try:
-                    self.target_db.set_zero_preserve_mode(False)
-                except:
-                    pass
+                # Sessão de carga: uma transação, sem verificação de FKs e com
+                # NO_AUTO_VALUE_ON_ZERO, preservando registros com ID=0
+                with self.target_db.bulk_load() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute(copy_query)
+                    copied_records = cursor.rowcount
                 
+                self.logger.info(f"Copiados {copied_records} registros preservando dados existentes")
+            else:
+                self.logger.warning(f"Nenhuma coluna em comum encontrada entre estruturas antiga e nova de {table_name}")
+            
+            # 5. Fazer backup da tabela original (para segurança)
+            self.logger.debug(f"Renomeando tabela original para backup: {backup_table}")
+            self.target_db.rename_table(table_name, backup_table)
+            
+            # 6. Renomear tabela temporária para o nome original
+            self.logger.debug(f"Renomeando tabela temporária {temp_table} para {table_name}")
+            self.target_db.rename_table(temp_table, table_name)
+            
+            # Marcar temp_table como None já que foi renomeado
+            temp_table = None
+            
+            # 7. Remover tabela de backup (opcional - pode manter para segurança)
+            self.logger.debug(f"Removendo tabela de backup {backup_table}")
+            self.target_db.drop_table_if_exists(backup_table)
+            backup_table = None
+            
+            self.logger.info(f"Estrutura de {table_name} atualizada com sucesso, dados preservados")
+            
         except Exception as e:
             # Em caso de erro, tenta fazer cleanup
             self.logger.error(f"Erro durante atualização estrutural de {table_name}: {e}")
             
             try:
-                # Desabilitar FK checks para cleanup
-                self.target_db.execute_query("SET FOREIGN_KEY_CHECKS = 0", fetch_results=False)
-                
                 # Remove tabela temporária se existir
                 if temp_table and self.target_db.table_exists(temp_table):
                     self.target_db.drop_table_if_exists(temp_table)
@@ -991,8 +1122,7 @@ class ReplicationManager:
                 if backup_table and self.target_db.table_exists(backup_table):
                     # Se tabela original não existe, restaura do backup
                     if not self.target_db.table_exists(table_name):
-                        restore_query = f"RENAME TABLE `{backup_table}` TO `{table_name}`"
-                        self.target_db.execute_query(restore_query, fetch_results=False)
+                        self.target_db.rename_table(backup_table, table_name)
                         self.logger.info(f"Tabela {table_name} restaurada do backup após erro")
                     else:
                         # Remove backup já que tabela original existe
@@ -1000,12 +1130,6 @@ class ReplicationManager:
                 
             except Exception as cleanup_error:
                 self.logger.error(f"Erro durante cleanup de {table_name}: {cleanup_error}")
-            finally:
-                # Reabilitar FK checks
-                try:
-                    self.target_db.execute_query("SET FOREIGN_KEY_CHECKS = 1", fetch_results=False)
-                except:
-                    pass
             
             # Re-lança a exceção original
             raise ReplicationError(f"Erro na atualização estrutural de {table_name}: {e}")
\ No newline at end of file
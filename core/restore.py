@@ -15,7 +15,7 @@ import time
 from .config import DatabaseConfig
 from .logger import LoggerManager
 from .database import DatabaseManager
-from .backup import BackupManager, BackupError
+from .backup import BackupManager, BackupError, PIPE_KWARGS, stream_to_process
 
 
 class RestoreError(Exception):
@@ -345,6 +345,9 @@ class RestoreManager:
             
         except Exception as e:
             raise RestoreError(f"Erro na execução da restauração: {e}")
+        finally:
+            # O schema pode ter mudado (mesmo em restauração parcial): descarta metadados em cache
+            self.db_manager.invalidate()
     
     def _is_mysql_client_available(self) -> bool:
         """Verifica se o cliente mysql está disponível"""
@@ -375,29 +378,24 @@ class RestoreManager:
         
         self.logger.debug("Usando mysql client para restauração")
         
+        # Arquivo comprimido ou não: envia em blocos para o stdin do mysql
+        # (memória limitada ao tamanho do bloco, sem carregar o dump inteiro)
         if backup_filepath.endswith('.gz'):
-            # Arquivo comprimido
-            with gzip.open(backup_filepath, 'rt', encoding='utf-8') as f:
-                process = subprocess.Popen(
-                    mysql_cmd,
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    universal_newlines=True
-                )
-                
-                stdout, stderr = process.communicate(input=f.read())
+            source = gzip.open(backup_filepath, 'rb')
         else:
-            # Arquivo não comprimido
-            with open(backup_filepath, 'r', encoding='utf-8') as f:
-                process = subprocess.Popen(
-                    mysql_cmd,
-                    stdin=f,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
-                )
-                
-                stdout, stderr = process.communicate()
+            source = open(backup_filepath, 'rb')
+        
+        with source:
+            process = subprocess.Popen(
+                mysql_cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                **PIPE_KWARGS
+            )
+            
+            stdout, stderr = stream_to_process(source, process)
+            stderr = stderr.decode('utf-8', errors='replace')
         
         if process.returncode != 0:
             raise RestoreError(f"Erro no mysql client: {stderr}")
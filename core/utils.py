@@ -3,9 +3,16 @@ Utilitários diversos para o sistema ReplicOOP
 """
 import re
 import hashlib
+import json
+import os
 from typing import Dict, Any, List
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson é opcional; usa o json da biblioteca padrão
+    orjson = None
+
 
 class DatabaseUtils:
     """Utilitários para operações com banco de dados"""
@@ -254,4 +261,78 @@ class ValidationUtils:
             if not ValidationUtils.validate_database_name(config['dbname']):
                 errors.append("Nome do banco de dados inválido")
         
-        return errors
\ No newline at end of file
+        return errors
+
+
+class JsonUtils:
+    """Utilitários para leitura e escrita de JSON (usa orjson quando disponível)"""
+    
+    @staticmethod
+    def load(filepath: str) -> Any:
+        """
+        Lê e decodifica um arquivo JSON
+        
+        Args:
+            filepath (str): Caminho do arquivo
+            
+        Returns:
+            Any: Conteúdo decodificado
+        """
+        with open(filepath, 'rb') as f:
+            data = f.read()
+        
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data.decode('utf-8'))
+    
+    @staticmethod
+    def loads(data: str) -> Any:
+        """
+        Decodifica um texto JSON
+        
+        Args:
+            data (str): Texto JSON
+            
+        Returns:
+            Any: Conteúdo decodificado
+        """
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    
+    @staticmethod
+    def dumps(obj: Any) -> str:
+        """
+        Codifica um objeto em JSON compacto de uma única linha
+        
+        Args:
+            obj (Any): Objeto a ser codificado
+            
+        Returns:
+            str: Texto JSON
+        """
+        if orjson is not None:
+            return orjson.dumps(obj).decode('utf-8')
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+    
+    @staticmethod
+    def dump(obj: Any, filepath: str) -> None:
+        """
+        Codifica e grava um objeto em arquivo JSON (UTF-8, indentação de 2 espaços)
+        
+        A gravação é atômica: escreve em um arquivo temporário e o publica com
+        os.replace, de modo que leitores nunca vejam um arquivo truncado.
+        
+        Args:
+            obj (Any): Objeto a ser gravado
+            filepath (str): Caminho do arquivo
+        """
+        if orjson is not None:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+        
+        temp_path = filepath + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, filepath)
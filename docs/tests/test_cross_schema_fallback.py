@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Teste do fallback da cópia entre schemas (INSERT ... SELECT no mesmo servidor)
+
+Simula um usuário de destino sem SELECT no schema de origem: a cópia deve falhar
+com DatabaseOperationError e a replicação deve seguir pelo caminho de INSERT em lotes.
+Não precisa de banco de dados: as conexões são substituídas por mocks.
+"""
+
+import sys
+import os
+from unittest import mock
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import mysql.connector
+
+from core.database import DatabaseManager, DatabaseOperationError
+from core.replication import ReplicationManager
+
+# Erro retornado pelo MySQL quando falta o privilégio SELECT no schema de origem
+DENIED_ERROR = mysql.connector.Error(
+    msg="SELECT command denied to user 'replicoop'@'%' for table 'clientes'", errno=1142
+)
+
+
+def _target_db_denying_cross_schema_select() -> DatabaseManager:
+    """Cria um DatabaseManager cujas conexões recusam o INSERT ... SELECT"""
+    config = mock.MagicMock(dbname='destino')
+    target_db = DatabaseManager(config, mock.MagicMock())
+    
+    def execute(query, *args, **kwargs):
+        # INSERT ou REPLACE ... SELECT lendo do schema de origem
+        if "FROM `origem`." in query:
+            raise DENIED_ERROR
+    
+    connection = mock.MagicMock()
+    connection.cursor.return_value.execute.side_effect = execute
+    target_db._create_connection = mock.MagicMock(return_value=connection)
+    return target_db
+
+
+def test_copy_table_from_schema_denied_raises_operation_error():
+    """A recusa do SELECT sai como DatabaseOperationError e a transação é desfeita"""
+    target_db = _target_db_denying_cross_schema_select()
+    
+    try:
+        target_db.copy_table_from_schema('origem', 'clientes', ['id', 'nome'])
+    except DatabaseOperationError:
+        pass
+    else:
+        raise AssertionError("copy_table_from_schema deveria lançar DatabaseOperationError")
+    
+    connection = target_db._create_connection.return_value
+    assert connection.rollback.called, "a transação da cópia deveria ser desfeita"
+    assert not connection.commit.called, "a cópia recusada não deveria ser confirmada"
+
+
+def test_replicate_table_data_falls_back_when_select_denied():
+    """Com a cópia entre schemas recusada, os dados seguem pelo INSERT em lotes"""
+    rows = [(0, 'zero'), (1, 'um')]
+    
+    source_db = mock.MagicMock()
+    source_db.config.dbname = 'origem'
+    source_db.get_table_structure.return_value = [
+        {'Field': 'id', 'Extra': 'auto_increment'},
+        {'Field': 'nome', 'Extra': ''}
+    ]
+    source_db.execute_query_tuples.return_value = [(1,)]
+    source_db.get_table_row_estimate.return_value = len(rows)
+    source_db.get_table_columns.return_value = [{'name': 'id'}, {'name': 'nome'}]
+    source_db.iter_table_data.side_effect = lambda *args, **kwargs: iter([rows])
+    
+    target_db = _target_db_denying_cross_schema_select()
+    target_db.supports_local_infile = mock.MagicMock(return_value=False)
+    target_db.execute_many_query = mock.MagicMock()
+    
+    # Sem __init__: não lê config.json nem cria arquivos de log
+    manager = ReplicationManager.__new__(ReplicationManager)
+    manager.logger = mock.MagicMock()
+    manager.config_manager = mock.MagicMock()
+    manager.config_manager.get_batch_size.return_value = 5000
+    manager.source_db = source_db
+    manager.target_db = target_db
+    manager._same_server = True
+    manager._dump_pipe_available = False
+    
+    manager._replicate_table_data('clientes', clear_target=False)
+    
+    assert target_db.execute_many_query.called, "o fallback de INSERT em lotes não foi executado"
+    query, inserted = target_db.execute_many_query.call_args[0][:2]
+    assert query.startswith("REPLACE INTO `clientes`"), query
+    assert list(inserted) == rows
+    assert any(
+        "INSERT ... SELECT indisponível" in str(call) for call in manager.logger.warning.call_args_list
+    ), "o fallback deveria ser registrado em log"
+
+
+if __name__ == "__main__":
+    tests = [
+        test_copy_table_from_schema_denied_raises_operation_error,
+        test_replicate_table_data_falls_back_when_select_denied
+    ]
+    
+    failures = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failures += 1
+            print(f"❌ {test.__name__}: {e}")
+    
+    exit(0 if failures == 0 else 1)
@@ -508,13 +508,14 @@ class ReplicOOPMenu:
             print("📭 Pasta de logs não encontrada")
             return
         
-        log_files = [f for f in os.listdir(logs_dir) if f.endswith('.log')]
+        # Inclui os arquivos rotacionados (replicoop.log.AAAA-MM-DD)
+        log_files = [f for f in os.listdir(logs_dir) if '.log' in f]
         
         if not log_files:
             print("📭 Nenhum arquivo de log encontrado")
             return
         
-        log_files.sort(reverse=True)
+        log_files.sort(key=lambda f: os.path.getmtime(os.path.join(logs_dir, f)), reverse=True)
         
         print(f"\n📋 {len(log_files)} arquivos de log encontrados:")
         for i, log_file in enumerate(log_files[:5], 1):  # Mostra últimos 5
@@ -559,7 +560,7 @@ class ReplicOOPMenu:
             # Estatísticas de logs
             logs_dir = "logs"
             if os.path.exists(logs_dir):
-                log_files = [f for f in os.listdir(logs_dir) if f.endswith('.log')]
+                log_files = [f for f in os.listdir(logs_dir) if '.log' in f]
                 print(f"\n📋 LOGS:")
                 print(f"   Arquivos de log: {len(log_files)}")
                 